@@ -1,22 +1,74 @@
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request, Response, g
 from flask_cors import CORS
-from scraper import NoticeScraper
+from driver_pool import ScraperPool
+from notice_index import NoticeIndex, normalize_date, feed_sort_key
+from storage import SQLiteStore
+from event_stream import EventBroadcaster, format_event
+from notice_ids import derive_article_id, make_notice_id
+from scheduler import CrawlScheduler
+from refresh_jobs import RefreshJobs
+from notice_body import NoticeBodyCache
+from retention import split_retained
+from canonical import CanonicalNotices, HOSEO_BOARD_SOURCES, CANONICAL_GROUP, canonical_notice_id
+from snapshot import SectionCache, SnapshotFile, SnapshotReader, encode_snapshot, write_snapshot, export_json
+from metrics import (REGISTRY, CRAWL_STAGE_SECONDS, CRAWL_DURATION_SECONDS, CRAWL_RESULTS, CRAWL_RETRIES,
+                     CRAWL_NEW_NOTICES, CONSECUTIVE_FAILURE_EVENTS, API_REQUEST_SECONDS, API_RESPONSE_BYTES,
+                     CACHED_NOTICES, STREAM_SUBSCRIBERS, DRIVER_POOL)
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
 import threading
 import time
 from datetime import datetime
 import atexit
+import gzip
+import hashlib
+import heapq
+import itertools
 import json
 import os
+import queue
+import sqlite3
 
 app = Flask(__name__)
 CORS(app)
 
 # ===== 설정 =====
-CACHE_FILE_PATH = os.path.join(os.path.dirname(__file__), 'cache.json')
-CACHE_UPDATE_INTERVAL = 3000  # 50분마다 백그라운드 크롤링
+CACHE_FILE_PATH = os.path.join(os.path.dirname(__file__), 'cache.json')  # 이전 JSON 캐시 (읽기 전용, 디버깅용 내보내기)
+CACHE_SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), 'cache.snap')  # 'file' 저장소의 캐시 스냅샷
+DB_PATH = os.path.join(os.path.dirname(__file__), 'notices.db')
+STORAGE_BACKEND = "sqlite"  # 'sqlite': 변경된 공지만 DB에 저장, 'file': cache.snap 스냅샷 파일에 저장
+CACHE_JSON_EXPORT = False  # 'file' 저장소에서 저장할 때마다 cache.json도 함께 내보내기 (디버깅용)
+CACHE_UPDATE_INTERVAL = 3000  # 소스별 기본 크롤링 주기 (50분)
+SCHEDULER_MIN_INTERVAL = 600  # 새 공지가 자주 올라오는 소스의 최소 주기 (10분)
+SCHEDULER_MAX_INTERVAL = 6 * 3600  # 변화가 없는 소스의 최대 주기 (6시간)
+SCHEDULER_RETRY_INTERVAL = 300  # 크롤링 실패 시 재시도 간격
 MAIN_PAGE_START = 2  # 2페이지부터 (1페이지는 상단공지)
-MAIN_PAGE_END = 5
+MAIN_PAGE_END = 5  # 증분 크롤링 시 새 공지가 없는 페이지에서 멈추므로 깊게 잡아도 됨
+INCREMENTAL_CRAWL = True  # 기존 캐시에 있는 공지만 있는 페이지를 만나면 이후 페이지 생략
+MAIN_FETCH_MODE = "http"  # 'http': 호서대 게시판을 브라우저 없이 크롤링, 'browser': Selenium 사용
+LIBRARY_FETCH_MODE = "api"  # 'api': 도서관 JSON API 직접 호출 (실패 시 브라우저로 재시도), 'browser': Selenium
+BROWSER_LEAN_MODE = True  # 브라우저에서 이미지·CSS·폰트와 알려진 분석·광고 도메인(LEAN_BLOCKED_URL_PATTERNS) 차단, eager 로딩
+STREAM_HEARTBEAT_SECONDS = 15  # SSE 연결 유지용 하트비트 주기
+STREAM_QUEUE_SIZE = 256  # SSE 구독자별 대기 이벤트 수 (초과 시 인덱스에서 다시 읽어 따라잡음)
+REMOVED_HISTORY = 5000  # /api/changes·SSE로 알릴 공지 삭제(아카이브 이동) 기록 수 (더 오래된 토큰은 전체 다시 받기)
+CRAWL_WORKERS = 4  # 동시에 크롤링할 소스 수 (1이면 순차 크롤링)
+MAX_CONSECUTIVE_FAILURES = 3  # 연속 실패 시 스크래퍼 재생성
+DRIVER_POOL_SIZE = None  # 미리 띄워 둘 브라우저 수 (None: 브라우저로 크롤링하는 소스 수, 최대 CRAWL_WORKERS. 예비 1개는 별도)
+DRIVER_MAX_PAGE_LOADS = 200  # 이 페이지 수를 열면 브라우저 교체
+DRIVER_MAX_RSS_MB = 1500  # 브라우저 메모리(MB)가 이 값을 넘으면 교체 (psutil 필요)
+RETENTION_MAX_AGE_DAYS = 180  # hot set 보존 기간 (게시일 기준, 지나면 아카이브로 이동)
+RETENTION_MAX_COUNT = 300  # 소스별 hot set 최대 건수 (초과분은 오래된 것부터 아카이브)
+RETENTION_OVERRIDES = {}  # 소스별 기준 변경 (예: {"library": {"max_count": 100}})
+CANDO_CLOSED_GRACE_DAYS = 3  # '마감'된 캔두 프로그램은 신청 기간 종료 후 이 기간이 지나면 아카이브
+BODY_CACHE_DIR = os.path.join(os.path.dirname(__file__), 'body_cache')  # 공지 본문 디스크 캐시
+BODY_CACHE_TTL = 7 * 24 * 3600  # 본문을 다시 가져오기까지의 기간 (7일)
+BODY_CACHE_MAX_BYTES = 16 * 1024 * 1024  # 메모리에 보관할 본문 최대 크기
+CRAWLER_MODE = os.environ.get("NOTICE_CRAWLER_MODE", "embedded")  # 'embedded': API 프로세스 안에서 크롤링, 'external': crawler.py가 발행한 스냅샷만 읽음, 'off': 저장된 캐시만 제공 (Selenium 로드 안 함)
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), 'snapshot.snap')  # crawler.py → API 워커 공유 스냅샷
+SNAPSHOT_POLL_SECONDS = 2  # API 워커가 스냅샷 교체를 확인하는 주기
+CRAWLER_LOCK_PATH = os.path.join(os.path.dirname(__file__), 'crawler.lock')  # 크롤러 리더 락 파일
+LEADER_RETRY_SECONDS = 30  # 대기 중인 크롤러가 리더 락을 다시 시도하는 주기
+REFRESH_JOB_HISTORY = 100  # /api/refresh/<id>로 조회할 수 있게 보관할 끝난 갱신 작업 수
 
 # ===== 소스 정의 =====
 SOURCES = {
@@ -70,72 +122,466 @@ SOURCES = {
 # ===== 캐시 및 상태 관리 =====
 cache = {source: {"data": [], "tags": [], "last_updated": None} for source in SOURCES}
 
+notice_index = NoticeIndex(max_removed=REMOVED_HISTORY)  # /api/notices 조회용 인덱스 (cache_lock으로 보호)
+canonical_notices = CanonicalNotices(list(SOURCES))  # 호서대 게시판 글 번호별 통합 공지 (cache_lock으로 보호)
+broadcaster = EventBroadcaster(queue_size=STREAM_QUEUE_SIZE)  # /api/stream 구독자
+crawl_scheduler = CrawlScheduler(SOURCES, CACHE_UPDATE_INTERVAL, SCHEDULER_MIN_INTERVAL,
+                                 SCHEDULER_MAX_INTERVAL, SCHEDULER_RETRY_INTERVAL)
+refresh_jobs = RefreshJobs(crawl_scheduler.schedule_now, max_finished=REFRESH_JOB_HISTORY)  # /api/refresh 작업
+
 cache_lock = threading.Lock()
-scraper_lock = threading.Lock()
-scraper = None
+def create_scraper():
+    """스크래퍼 생성 (scraper 모듈은 처음 필요할 때, Selenium은 브라우저를 처음 띄울 때 로드)"""
+    from scraper import NoticeScraper
+    return NoticeScraper(fetch_mode=MAIN_FETCH_MODE, lean=BROWSER_LEAN_MODE)
+
+scraper_pool = ScraperPool(create_scraper,
+                           size=DRIVER_POOL_SIZE or 1, max_page_loads=DRIVER_MAX_PAGE_LOADS,
+                           max_rss_mb=DRIVER_MAX_RSS_MB)
+worker_local = threading.local()  # 병렬 크롤링 워커별 연속 실패 횟수
 background_thread = None
 is_running = True
+all_snapshot = None  # 미리 직렬화·압축한 /api/all 응답 {"body", "gzip", "etag", "build"}
+all_snapshot_builds = 0  # /api/all 스냅샷 직렬화 순번 (cache_lock으로 보호)
+store = None  # SQLite 저장소 (STORAGE_BACKEND == 'sqlite')
+dirty_sources = set()  # 마지막 저장 이후 변경된 소스 (cache_lock으로 보호)
+change_seq = 0  # 마지막으로 부여한 변경 순번 (cache_lock으로 보호)
+pending_archive = {}  # 아카이브에 아직 저장하지 않은 공지 {source: [notice, ...]} (cache_lock으로 보호)
+archived_index = {}  # 아카이브로 옮긴 공지 {source: {글 번호: (제목, 링크)}} (다시 수집하지 않도록, cache_lock으로 보호)
+publish_snapshots = False  # 크롤링 주기마다 공유 스냅샷 발행 (crawler.py)
+crawler_mode = "embedded"  # 실제로 시작한 모드 ('embedded', 'external', 'off')
+snapshot_reader = None  # 크롤러 프로세스의 스냅샷을 읽는 API 워커인 경우 SnapshotReader
+crawler_status = None  # 스냅샷에 담겨 온 크롤러 프로세스 상태 (API 워커)
+source_versions = {source: 0 for source in SOURCES}  # 소스 캐시가 바뀔 때마다 증가 (cache_lock으로 보호)
+section_cache = SectionCache()  # 소스별 스냅샷 섹션 인코딩 결과 (cache_lock으로 보호)
+installed_digests = {}  # API 워커가 마지막으로 반영한 소스별 섹션 다이제스트
+
+def next_change_seq():
+    """공지 추가/변경 시 부여할 다음 순번 (cache_lock 안에서 호출)"""
+    global change_seq
+    change_seq += 1
+    return change_seq
+
+def index_source(source_key, record_removals=True):
+    """소스 캐시를 조회 인덱스에 반영 (호서대 게시판은 글 번호별로 합쳐서). cache_lock 안에서 호출
+    
+    record_removals: 목록에서 빠진 공지에 삭제 순번 부여 (삭제 기록을 스냅샷으로 받는 API 워커는 False)
+    """
+    data = cache[source_key]["data"]
+    next_seq = next_change_seq if record_removals else None
+    if source_key in HOSEO_BOARD_SOURCES:
+        canonical_notices.update_source(source_key, data)
+        notice_index.update_source(CANONICAL_GROUP, canonical_notices.notices(), next_seq)
+    else:
+        notice_index.update_source(source_key, data, next_seq)
+
+def removal_meta():
+    """저장·스냅샷 메타에 넣을 변경 순번과 삭제 기록. cache_lock 안에서 호출"""
+    return {"changeSeq": change_seq, "removed": notice_index.removals(), "removedFloor": notice_index.removed_floor}
+
+def install_removal_meta(meta):
+    """저장된 삭제 기록 복원 (삭제 순번이 다시 쓰이지 않도록 변경 순번도). cache_lock 안에서 호출"""
+    global change_seq
+    notice_index.load_removals(meta.get("removed", []), meta.get("removedFloor", 0))
+    change_seq = max(change_seq, meta.get("changeSeq", 0))
+
+def retention_policy(source_key):
+    """소스의 hot set 보존 기준"""
+    policy = {
+        "max_age_days": RETENTION_MAX_AGE_DAYS,
+        "max_count": RETENTION_MAX_COUNT,
+        "closed_grace_days": CANDO_CLOSED_GRACE_DAYS if source_key == "cando" else None
+    }
+    policy.update(RETENTION_OVERRIDES.get(source_key, {}))
+    return policy
+
+def enforce_retention(source_key, notices):
+    """보존 기준을 벗어난 공지를 아카이브 대기열로 옮기고 남은 공지 반환. cache_lock 안에서 호출"""
+    kept, expired = split_retained(notices, **retention_policy(source_key))
+    if expired:
+        pending_archive.setdefault(source_key, []).extend(expired)
+        archived = archived_index.setdefault(source_key, {})
+        for notice in expired:
+            archived[notice["articleId"]] = (notice.get("title", ""), notice.get("link", ""))
+        dirty_sources.add(source_key)
+    return kept
+
+def drop_retired(source_key, notices):
+    """크롤링 결과에서 이미 아카이브했거나 보존 기준을 벗어난 공지를 병합 전에 제외. cache_lock 안에서 호출
+    
+    hot set에 없는 지난 공지가 다시 들어와 새 순번·SSE 이벤트를 받고 아카이브에 또 쓰이는 것을 막는다.
+    """
+    current = {n["id"] for n in cache[source_key]["data"]}
+    archived = archived_index.get(source_key, {})
+    candidates = [n for n in notices if n["id"] not in current and n["articleId"] not in archived]
+    # 건수 기준은 병합 후에 적용 (여기서는 기간·마감 기준만)
+    kept, _ = split_retained(candidates, **{**retention_policy(source_key), "max_count": None})
+    kept_ids = {n["id"] for n in kept}
+    return [n for n in notices if n["id"] in current or n["id"] in kept_ids]
+
+def load_archived_keys():
+    """아카이브에 저장된 공지 키를 불러옴 (크롤러 시작 시)"""
+    try:
+        keys = get_store().archived_keys()
+    except Exception as e:
+        print(f"[WARNING] 아카이브 키 로드 실패: {e}")
+        return
+    with cache_lock:
+        for source_key, archived in keys.items():
+            archived_index.setdefault(source_key, {}).update(archived)
+
+def flush_archive():
+    """아카이브 대기열을 DB에 저장 (실패하면 다음 저장 때 다시 시도)"""
+    with cache_lock:
+        pending = dict(pending_archive)
+        pending_archive.clear()
+    if not pending:
+        return
+    
+    try:
+        db = get_store()
+        total = sum(db.archive_notices(source_key, notices) for source_key, notices in pending.items())
+        print(f"[{datetime.now()}] 아카이브 저장 완료: {total}건")
+    except Exception as e:
+        with cache_lock:
+            for source_key, notices in pending.items():
+                pending_archive.setdefault(source_key, [])[:0] = notices
+        print(f"[ERROR] 아카이브 저장 실패: {e}")
+
+def _install_loaded_cache(loaded_cache, meta=None):
+    """저장소에서 읽은 캐시를 메모리 캐시·인덱스·/api/all 스냅샷에 반영 (meta: 저장해 둔 변경 순번·삭제 기록)"""
+    global change_seq
+    expired_ids = set()
+    with cache_lock:
+        for source_key in SOURCES:
+            if source_key in loaded_cache:
+                cache[source_key] = loaded_cache[source_key]
+                loaded = assign_stable_ids(source_key, cache[source_key]["data"])
+                cache[source_key]["data"] = enforce_retention(source_key, loaded)
+                kept_ids = {n["id"] for n in cache[source_key]["data"]}
+                expired_ids.update(canonical_notice_id(n) for n in loaded if n["id"] not in kept_ids)
+                source_versions[source_key] += 1
+        
+        # 변경 순번 복원 (순번이 없던 이전 캐시는 새로 부여)
+        all_data = [n for source_key in SOURCES for n in cache[source_key]["data"]]
+        change_seq = max((n.get("seq", 0) for n in all_data), default=0)
+        if meta:
+            install_removal_meta(meta)
+        for notice in all_data:
+            if "seq" not in notice:
+                notice["seq"] = next_change_seq()
+        
+        for source_key in SOURCES:
+            if source_key in loaded_cache:
+                index_source(source_key)
+        
+        # 저장 이후 보존 기간이 지나 로드하면서 아카이브로 옮긴 공지도 삭제로 알림
+        for notice_id in sorted(expired_ids):
+            if notice_index.get(notice_id) is None:
+                notice_index.record_removal(notice_id, next_change_seq())
+    build_all_snapshot()
 
 def load_cache_from_file():
-    """JSON 파일에서 캐시 로드"""
-    global cache
+    """스냅샷 파일에서 캐시 로드 (소스별 섹션을 차례로 디코딩, 없으면 이전 cache.json)"""
     try:
+        if os.path.exists(CACHE_SNAPSHOT_PATH):
+            snapshot = SnapshotFile(CACHE_SNAPSHOT_PATH)
+            try:
+                _install_loaded_cache(snapshot, snapshot.meta)
+            finally:
+                snapshot.close()
+            print(f"[{datetime.now()}] 캐시 파일 로드 완료: {CACHE_SNAPSHOT_PATH}")
+            return True
         if os.path.exists(CACHE_FILE_PATH):
             with open(CACHE_FILE_PATH, 'r', encoding='utf-8') as f:
                 loaded_cache = json.load(f)
-                with cache_lock:
-                    for source_key in SOURCES:
-                        if source_key in loaded_cache:
-                            cache[source_key] = loaded_cache[source_key]
-                print(f"[{datetime.now()}] 캐시 파일 로드 완료: {CACHE_FILE_PATH}")
-                return True
+            _install_loaded_cache(loaded_cache)
+            print(f"[{datetime.now()}] 캐시 파일 로드 완료: {CACHE_FILE_PATH}")
+            return True
     except Exception as e:
         print(f"[WARNING] 캐시 파일 로드 실패: {e}")
     return False
 
+def get_store():
+    """SQLite 저장소 (크롤링하지 않는 프로세스는 DB를 쓰지 않도록 읽기 전용으로 엶)"""
+    global store
+    if store is None:
+        store = SQLiteStore(DB_PATH, read_only=crawler_mode != "embedded")
+    return store
+
+def archived_counts():
+    """소스별 아카이브 공지 수 (DB가 없거나 읽을 수 없으면 빈 값). cache_lock 밖에서 호출"""
+    try:
+        return get_store().count_archived()
+    except sqlite3.Error as e:
+        print(f"[WARNING] 아카이브 건수 조회 실패: {e}")
+        return {}
+
+def load_cache_from_db():
+    """SQLite DB에서 캐시 로드 (크롤링하는 프로세스는 처음 실행 시 cache.json을 DB로 이전)"""
+    try:
+        db = get_store()
+        if not db.read_only:
+            migrated = db.migrate_from_json(CACHE_FILE_PATH, SOURCES)
+            if migrated:
+                print(f"[{datetime.now()}] cache.json → DB 이전 완료: {migrated}건")
+        if db.is_empty():
+            return False
+        _install_loaded_cache(db.load_all(SOURCES), json.loads(db.get_meta("removal_meta") or "{}"))
+        print(f"[{datetime.now()}] DB 캐시 로드 완료: {DB_PATH}")
+        return True
+    except Exception as e:
+        print(f"[WARNING] DB 캐시 로드 실패: {e}")
+    return False
+
+def save_cache_to_db():
+    """마지막 저장 이후 변경된 소스만 DB에 upsert (내용이 바뀐 행만 기록)"""
+    with cache_lock:
+        source_keys = list(dirty_sources)
+        dirty_sources.clear()
+        copies = {
+            k: ([dict(n) for n in cache[k]["data"]], list(cache[k]["tags"]), cache[k]["last_updated"])
+            for k in source_keys
+        }
+        meta = removal_meta()
+    
+    try:
+        db = get_store()
+        total_changed = 0
+        for source_key, (data, tags, last_updated) in copies.items():
+            with CRAWL_STAGE_SECONDS.time(source=source_key, stage="save"):
+                changed, _ = db.upsert_source(source_key, data, tags, last_updated)
+            total_changed += changed
+        db.set_meta("removal_meta", json.dumps(meta, ensure_ascii=False))
+        print(f"[{datetime.now()}] DB 저장 완료: {len(copies)}개 소스, 변경 {total_changed}건")
+        return True
+    except Exception as e:
+        with cache_lock:
+            dirty_sources.update(source_keys)
+        print(f"[ERROR] DB 저장 실패: {e}")
+        return False
+
+def load_cache():
+    """설정된 저장소에서 캐시 로드"""
+    if STORAGE_BACKEND == "sqlite":
+        return load_cache_from_db()
+    return load_cache_from_file()
+
+def save_cache():
+    """설정된 저장소에 캐시 저장 (아카이브로 옮길 공지를 먼저 기록)"""
+    flush_archive()
+    if STORAGE_BACKEND == "sqlite":
+        return save_cache_to_db()
+    return save_cache_to_file()
+
+def cache_sections():
+    """스냅샷에 쓸 소스별 섹션 (마지막 인코딩 이후 바뀐 소스만 다시 인코딩). cache_lock 안에서 호출"""
+    entries = {}
+    for source_key in SOURCES:
+        notices = cache[source_key]["data"]
+        section, digest = section_cache.encode(source_key, source_versions[source_key], notices)
+        entries[source_key] = {
+            "section": section,
+            "digest": digest,
+            "count": len(notices),
+            "tags": list(cache[source_key]["tags"]),
+            "last_updated": cache[source_key]["last_updated"]
+        }
+    return entries
+
 def save_cache_to_file():
-    """캐시를 JSON 파일로 저장"""
+    """캐시를 스냅샷 파일로 저장 (락은 바뀐 소스를 인코딩하는 동안만, 파일은 원자적으로 교체)"""
     try:
         with cache_lock:
-            cache_copy = {k: v.copy() for k, v in cache.items()}
+            meta = {**removal_meta(), "savedAt": datetime.now().isoformat()}
+            entries = cache_sections()
         
-        with open(CACHE_FILE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(cache_copy, f, ensure_ascii=False, indent=2)
-        print(f"[{datetime.now()}] 캐시 파일 저장 완료: {CACHE_FILE_PATH}")
+        with CRAWL_STAGE_SECONDS.time(source="all", stage="save"):
+            write_snapshot(CACHE_SNAPSHOT_PATH, encode_snapshot(meta, entries))
+            if CACHE_JSON_EXPORT:
+                export_json(CACHE_SNAPSHOT_PATH, CACHE_FILE_PATH)
+        print(f"[{datetime.now()}] 캐시 파일 저장 완료: {CACHE_SNAPSHOT_PATH}")
         return True
     except Exception as e:
         print(f"[ERROR] 캐시 파일 저장 실패: {e}")
         return False
 
-def get_scraper():
-    global scraper
-    with scraper_lock:
-        if scraper is None:
-            scraper = NoticeScraper()
-        return scraper
-
-def reset_scraper():
-    """드라이버 세션 문제 시 스크래퍼 재생성"""
-    global scraper
-    with scraper_lock:
-        if scraper is not None:
-            try:
-                scraper.close()
-            except:
-                pass
-            scraper = None
-        scraper = NoticeScraper()
-        return scraper
-
-def close_scraper():
-    global scraper
-    with scraper_lock:
-        if scraper is not None:
-            try:
-                scraper.close()
-            except:
-                pass
-            scraper = None
+def iter_feed():
+    """소스별 최신순 목록을 k-way 병합한 통합 피드 (호서대 게시판 공지는 글 번호당 한 번). cache_lock 안에서 사용
+    
+    필요한 만큼만 꺼내면 되므로 상위 N건은 itertools.islice로 전체 정렬 없이 얻는다.
+    """
+    seen_articles = set()
+    streams = [cache[source_key]["data"] for source_key in SOURCES]
+    for notice in heapq.merge(*streams, key=feed_sort_key, reverse=True):
+        if notice.get("source") not in HOSEO_BOARD_SOURCES:
+            yield notice
+        elif notice["articleId"] not in seen_articles:
+            # 여러 게시판에 올라온 공지는 통합 공지로 (categories로 소속 표시)
+            seen_articles.add(notice["articleId"])
+            yield canonical_notices.notice(notice["articleId"])
+
+def build_all_snapshot():
+    """/api/all 응답을 캐시가 바뀔 때 한 번만 직렬화·압축하고 ETag 부여
+    
+    병렬 크롤링 워커가 동시에 만들 수 있으므로 직렬화 순번이 더 늦은 스냅샷만 교체한다
+    (먼저 직렬화했지만 압축이 늦게 끝난 스냅샷이 최신 스냅샷을 덮어쓰지 않도록).
+    """
+    global all_snapshot, all_snapshot_builds
+    all_tags = set()
+    source_counts = {}
+    
+    with cache_lock:
+        all_snapshot_builds += 1
+        build = all_snapshot_builds
+        for source_key in SOURCES:
+            all_tags.update(cache[source_key]["tags"])
+            source_counts[source_key] = len(cache[source_key]["data"])
+        
+        # 소스별 목록이 이미 최신순이므로 병합만 (전체 정렬 없음)
+        all_notices = list(iter_feed())
+        
+        body = json.dumps({
+            "success": True,
+            "notices": all_notices,
+            "tags": list(all_tags),
+            "sources": SOURCES,
+            "sourceCounts": source_counts,
+            "token": str(change_seq),
+            "cached": True
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    snapshot = {
+        "body": body,
+        "gzip": gzip.compress(body, compresslevel=6),
+        "etag": hashlib.sha1(body).hexdigest()[:20],
+        "build": build
+    }
+    with cache_lock:
+        if all_snapshot is None or all_snapshot["build"] < build:
+            all_snapshot = snapshot
+        return all_snapshot
+
+def publish_snapshot():
+    """현재 캐시를 API 워커용 공유 스냅샷 파일로 발행 (crawler.py)"""
+    status = {"pid": os.getpid(), "schedule": crawl_scheduler.status(), "driverPool": scraper_pool.status()}
+    try:
+        with cache_lock:
+            meta = {**removal_meta(), "publishedAt": datetime.now().isoformat(), "crawler": status}
+            entries = cache_sections()
+        data = encode_snapshot(meta, entries)
+        write_snapshot(SNAPSHOT_PATH, data)
+        print(f"[{datetime.now()}] 스냅샷 발행 완료: {SNAPSHOT_PATH} ({len(data)} bytes)")
+        return True
+    except Exception as e:
+        print(f"[ERROR] 스냅샷 발행 실패: {e}")
+        return False
+
+def install_snapshot(snapshot):
+    """크롤러 프로세스가 발행한 스냅샷을 메모리 캐시·인덱스에 반영하고 새 변경을 SSE로 전달
+    
+    섹션 다이제스트가 바뀐 소스만 디코딩·재색인하고, 디코딩은 cache_lock 밖에서 한다.
+    """
+    global change_seq, crawler_status
+    known = [k for k in snapshot.sources() if k in SOURCES]
+    changed = {k: snapshot.load_source(k) for k in known
+               if snapshot.info(k)["digest"] != installed_digests.get(k)}
+    
+    with cache_lock:
+        seq_before = change_seq
+        changed_ids, existed = collect_changes(
+            [n for entry in changed.values() for n in entry["data"]], seq_before)
+        
+        for source_key, entry in changed.items():
+            cache[source_key] = entry
+            source_versions[source_key] += 1
+            index_source(source_key, record_removals=False)
+        for source_key in known:
+            # 내용이 그대로인 소스도 태그·갱신 시각은 반영
+            info = snapshot.info(source_key)
+            cache[source_key]["tags"] = list(info["tags"])
+            cache[source_key]["last_updated"] = info["last_updated"]
+        change_seq = snapshot.meta["changeSeq"]
+        install_removal_meta(snapshot.meta)
+        crawler_status = {**snapshot.meta.get("crawler", {}), "publishedAt": snapshot.meta.get("publishedAt")}
+        
+        # 크롤러가 캐시를 새로 시작해 순번이 줄었으면 전달할 변경이 없음
+        if seq_before and change_seq >= seq_before:
+            publish_changes(changed_ids, existed, seq_before)
+    installed_digests.update({k: snapshot.info(k)["digest"] for k in known})
+    build_all_snapshot()
+
+def snapshot_watcher():
+    """공유 스냅샷이 교체되면 다시 읽어 반영 (API 워커)"""
+    waiting_logged = False
+    while is_running:
+        try:
+            snapshot = snapshot_reader.poll()
+            if snapshot is not None:
+                install_snapshot(snapshot)
+                print(f"[{datetime.now()}] 스냅샷 반영 완료 (순번 {snapshot.meta['changeSeq']}, 발행 {snapshot.meta.get('publishedAt')})")
+            elif crawler_status is None and not waiting_logged:
+                print(f"[WARNING] 스냅샷 파일 대기 중: {SNAPSHOT_PATH} (crawler.py 실행 여부 확인)")
+                waiting_logged = True
+        except Exception as e:
+            print(f"[ERROR] 스냅샷 반영 실패: {e}")
+        time.sleep(SNAPSHOT_POLL_SECONDS)
+
+def start_snapshot_watcher():
+    """크롤링 없이 crawler.py가 발행한 스냅샷만 읽는 API 워커로 시작"""
+    global snapshot_reader, background_thread, crawler_mode
+    crawler_mode = "external"
+    snapshot_reader = SnapshotReader(SNAPSHOT_PATH)
+    try:
+        snapshot = snapshot_reader.poll()
+        if snapshot is not None:
+            install_snapshot(snapshot)
+    except Exception as e:
+        print(f"[WARNING] 스냅샷 로드 실패: {e}")
+    
+    background_thread = threading.Thread(target=snapshot_watcher, name="snapshot-watcher", daemon=True)
+    background_thread.start()
+    print(f"[{datetime.now()}] API 워커 시작됨 (스냅샷: {SNAPSHOT_PATH}, {SNAPSHOT_POLL_SECONDS}초마다 확인)")
+
+def start_serve_only():
+    """크롤링 없이 저장된 캐시만 제공 (읽기 전용 복제본, Selenium을 불러오지 않음)"""
+    global crawler_mode
+    crawler_mode = "off"
+    if load_cache():
+        print(f"[{datetime.now()}] 읽기 전용 모드 시작됨 (저장된 캐시 제공, 크롤링 안 함)")
+    else:
+        print(f"[WARNING] 읽기 전용 모드: 저장된 캐시가 없습니다")
+
+def start_server():
+    """CRAWLER_MODE에 맞게 시작 (external: 스냅샷 구독, off: 저장된 캐시만, 그 외: 프로세스 안에서 크롤링)"""
+    if CRAWLER_MODE == "external":
+        start_snapshot_watcher()
+    elif CRAWLER_MODE == "off":
+        start_serve_only()
+    else:
+        start_background_crawler()
+
+def fetch_notice_body(notice):
+    """공지 상세 페이지 본문 가져오기 (HTTP 전용 스크래퍼 사용)"""
+    with scraper_pool.lease(browser=False) as s:
+        s.source_label = notice["source"]
+        return s.notice_body(notice["source"], notice.get("link"), notice.get("articleId"))
+
+body_cache = NoticeBodyCache(fetch_notice_body, BODY_CACHE_DIR, BODY_CACHE_TTL, BODY_CACHE_MAX_BYTES)
+
+def needs_browser(source_key, fallback=False):
+    """Selenium 드라이버가 필요한 소스인지 (fallback: HTTP 수집이 실패해 브라우저로 재시도하는 경우)"""
+    if source_key == "cando":
+        return True
+    if source_key == "library":
+        return LIBRARY_FETCH_MODE == "browser" or fallback
+    return MAIN_FETCH_MODE == "browser"
+
+def browser_pool_size():
+    """미리 띄워 둘 브라우저 수 (0이면 브라우저가 필요한 소스가 없어 필요할 때만 띄움)"""
+    if DRIVER_POOL_SIZE is not None:
+        return DRIVER_POOL_SIZE
+    return min(max(CRAWL_WORKERS, 1), sum(1 for source_key in SOURCES if needs_browser(source_key)))
 
 def extract_tags(title):
     """제목에서 [xxxx] 형태의 태그 추출"""
@@ -145,16 +591,20 @@ def extract_tags(title):
 def process_notices(notices, source):
     """공지사항 데이터에 태그 정보 추가"""
     processed = []
+    article_ids = notices.get("글번호") or []
     for i in range(len(notices["제목"])):
         title = notices["제목"][i]
         link = notices["링크"][i]
         tags = extract_tags(title)
+        article_id = derive_article_id(title, link, article_ids[i] if i < len(article_ids) else None)
         
         notice_data = {
-            "id": f"{source}-{i + 1}",
+            "id": make_notice_id(source, article_id),
+            "articleId": article_id,
             "title": title,
             "link": link,
             "date": notices["날짜"][i],
+            "isoDate": normalize_date(notices["날짜"][i]),  # 정렬용 (날짜 없음이면 None)
             "tags": tags,
             "source": source,
             "sourceName": SOURCES[source]["name"],
@@ -165,28 +615,55 @@ def process_notices(notices, source):
         # 캔두의 경우 상태 정보 추가
         if "상태" in notices and i < len(notices["상태"]):
             notice_data["status"] = notices["상태"][i]
+        end_dates = notices.get("종료일") or []
+        if i < len(end_dates) and end_dates[i]:
+            notice_data["endDate"] = end_dates[i]
         
         processed.append(notice_data)
     return processed
 
+def assign_stable_ids(source_key, notices):
+    """저장된 공지에 고유 ID 부여 (이전 버전의 순번 ID 대체). 같은 ID가 겹치면 최근 변경분만 남김"""
+    by_id = {}
+    for notice in notices:
+        article_id = notice.get("articleId") or derive_article_id(notice.get("title", ""), notice.get("link", ""))
+        notice["articleId"] = article_id
+        notice["id"] = make_notice_id(source_key, article_id)
+        notice["isoDate"] = normalize_date(notice.get("date"))
+        previous = by_id.get(notice["id"])
+        if previous is None or notice.get("seq", 0) >= previous.get("seq", 0):
+            by_id[notice["id"]] = notice
+    return sorted(by_id.values(), key=feed_sort_key, reverse=True)
+
 def merge_notices(existing_data, new_data, source_key=None):
-    """기존 데이터와 새 데이터를 병합 (중복 제거, 새 공지 추가)"""
-    # 기존 데이터를 (title, link) 기준으로 딕셔너리화
+    """기존 데이터와 새 데이터를 병합 (중복 제거, 새 공지 추가)
+    
+    새로 추가되거나 내용이 바뀐 공지에는 변경 순번(seq)을 부여한다. cache_lock 안에서 호출.
+    기존 목록은 최신순으로 정렬되어 있다고 보고, 새 공지만 정렬해서 끼워 넣는다.
+    """
+    # 기존 데이터를 고유 ID 기준으로 딕셔너리화 (ID가 바뀐 공지는 (title, link)로도 찾음)
     existing_map = {}
+    key_map = {}
     for notice in existing_data:
-        key = (notice.get("title", ""), notice.get("link", ""))
-        existing_map[key] = notice
+        existing_map[notice["id"]] = notice
+        key_map[(notice.get("title", ""), notice.get("link", ""))] = notice["id"]
     
     # 새 데이터 병합 (새 공지 추가, 기존 공지 업데이트)
     new_count = 0
     updated_count = 0
     status_changed_count = 0
+    added = []
+    resort = False  # 기존 공지의 날짜가 바뀌면 전체를 다시 정렬
     
     for notice in new_data:
-        key = (notice.get("title", ""), notice.get("link", ""))
+        key = notice["id"]
+        if key not in existing_map:
+            key = key_map.get((notice.get("title", ""), notice.get("link", "")), key)
         if key not in existing_map:
             # 새로운 공지 추가
+            notice["seq"] = next_change_seq()
             existing_map[key] = notice
+            added.append(notice)
             new_count += 1
         else:
             # 캔두의 경우 상태 변화 감지
@@ -197,42 +674,39 @@ def merge_notices(existing_data, new_data, source_key=None):
                     status_changed_count += 1
                     print(f"[STATUS] '{notice.get('title', '')[:30]}...' 상태 변경: {old_status} → {new_status}")
             
-            # 기존 공지 업데이트
-            existing_map[key].update(notice)
+            # 기존 공지 업데이트 (내용이 바뀌었으면 새 순번 부여)
+            existing = existing_map[key]
+            changed = any(existing.get(k) != v for k, v in notice.items() if k != "seq")
+            resort = resort or feed_sort_key(existing) != feed_sort_key(notice)
+            existing.update(notice)
+            if changed:
+                existing["seq"] = next_change_seq()
+            if key != notice["id"]:
+                # 글 번호를 새로 알게 된 공지는 새 ID로 옮김
+                existing_map[notice["id"]] = existing_map.pop(key)
             updated_count += 1
     
-    # 결과를 리스트로 변환
-    merged_list = list(existing_map.values())
+    # 최신순 목록 유지: 새 공지만 정렬한 뒤 기존 목록과 병합
+    added.sort(key=feed_sort_key, reverse=True)
+    if resort:
+        merged_list = sorted(existing_data + added, key=feed_sort_key, reverse=True)
+    else:
+        merged_list = list(heapq.merge(existing_data, added, key=feed_sort_key, reverse=True))
     
     return merged_list, new_count, updated_count, status_changed_count
 
-def crawl_source(source_key):
-    """특정 소스 크롤링"""
+def crawl_source(source_key, cycle_known=None):
+    """특정 소스 크롤링 (cycle_known: 이번 주기에 전체 게시판에서 받은 (제목, 링크), 카테고리 게시판 증분 기준)"""
     max_retries = 2
     
     for attempt in range(max_retries):
+        fallback = attempt > 0  # 재시도는 브라우저로 (도서관 API 실패 대비)
+        if attempt > 0:
+            CRAWL_RETRIES.inc(source=source_key)
         try:
-            s = get_scraper()
-            
-            if source_key == "library":
-                notices = s.library()
-            elif source_key == "main":
-                notices = s.main_pg(page_start=MAIN_PAGE_START, page_end=MAIN_PAGE_END)
-            elif source_key == "fusion":
-                notices = s.main_fusion()
-            elif source_key == "academic":
-                notices = s.main_academic()
-            elif source_key == "scholarship":
-                notices = s.main_scholarship()
-            elif source_key == "volunteer":
-                notices = s.main_volunteer()
-            elif source_key == "external":
-                notices = s.main_external()
-            elif source_key == "career":
-                notices = s.main_career()
-            elif source_key == "cando":
-                notices = s.cando()
-            else:
+            with scraper_pool.lease(browser=needs_browser(source_key, fallback)) as s:
+                notices = _crawl_with(s, source_key, fallback, cycle_known)
+            if notices is None:
                 return None, None
             
             processed = process_notices(notices, source_key)
@@ -243,123 +717,298 @@ def crawl_source(source_key):
             
             return processed, list(all_tags)
         except Exception as e:
-            error_msg = str(e).lower()
             print(f"[ERROR] {source_key} 크롤링 실패 (시도 {attempt + 1}/{max_retries}): {e}")
             
-            # 세션 관련 오류면 드라이버 재생성
-            if "invalid session" in error_msg or "session" in error_msg or "disconnected" in error_msg:
-                print(f"[INFO] 세션 오류 감지, 드라이버 재생성...")
-                reset_scraper()
-            
             if attempt == max_retries - 1:
                 return None, None
     
     return None, None
 
-def update_cache():
-    """전체 캐시 업데이트 (기존 데이터 유지, 새 데이터 병합)"""
-    global cache
+def _crawl_with(s, source_key, fallback=False, cycle_known=None):
+    """대여한 스크래퍼로 소스 하나의 원본 목록 수집 (세션 오류 시 해당 인스턴스는 교체 표시)"""
+    s.source_label = source_key
+    try:
+        # 증분 크롤링: 이미 수집된 (제목, 링크) 목록
+        known = None
+        if INCREMENTAL_CRAWL:
+            with cache_lock:
+                known = {(n.get("title", ""), n.get("link", "")) for n in cache[source_key]["data"]}
+                # 카테고리 게시판은 이번 주기에 전체 게시판에서 받은 글만 있는 페이지에서도 멈춤
+                # (처음 크롤링하는 게시판은 소속 정보를 모으기 위해 끝까지)
+                if known and cycle_known:
+                    known |= cycle_known
+                # 아카이브로 옮긴 공지만 있는 페이지에서도 멈춤
+                known |= set(archived_index.get(source_key, {}).values())
+        
+        if source_key == "library":
+            notices = s.library(mode="browser" if fallback else LIBRARY_FETCH_MODE)
+        elif source_key == "main":
+            notices = s.main_pg(page_start=MAIN_PAGE_START, page_end=MAIN_PAGE_END, known_keys=known)
+        elif source_key == "fusion":
+            notices = s.main_fusion(known_keys=known)
+        elif source_key == "academic":
+            notices = s.main_academic(known_keys=known)
+        elif source_key == "scholarship":
+            notices = s.main_scholarship(known_keys=known)
+        elif source_key == "volunteer":
+            notices = s.main_volunteer(known_keys=known)
+        elif source_key == "external":
+            notices = s.main_external(known_keys=known)
+        elif source_key == "career":
+            notices = s.main_career(known_keys=known)
+        elif source_key == "cando":
+            notices = s.cando()  # 상태 변경을 놓치지 않도록 항상 전체
+        else:
+            return None
+        
+        return notices
+    except Exception as e:
+        error_msg = str(e).lower()
+        # 세션 관련 오류면 반납 시 드라이버 교체
+        if "invalid session" in error_msg or "session" in error_msg or "disconnected" in error_msg:
+            print("[INFO] 세션 오류 감지, 드라이버 교체 예약...")
+            scraper_pool.discard(s)
+        raise
+
+def collect_changes(notices, seq_before):
+    """seq_before 이후 바뀐 공지의 조회용 ID(호서대 게시판은 통합 공지)와 반영 전 존재 여부. cache_lock 안에서 인덱스 반영 전에 호출"""
+    changed_ids = {}
+    for notice in sorted((n for n in notices if n.get("seq", 0) > seq_before), key=lambda n: n["seq"]):
+        changed_ids[canonical_notice_id(notice)] = notice["seq"]
+    existed = {notice_id for notice_id in changed_ids if notice_index.get(notice_id) is not None}
+    return changed_ids, existed
+
+def publish_changes(changed_ids, existed, seq_before):
+    """새 공지·변경된 공지와 seq_before 이후 삭제된 공지를 SSE 구독자에게 순번 순서대로 전달
+    (순서 보장을 위해 cache_lock 안에서 호출). 전달한 변경 수 반환
+    """
+    changed = [notice for notice in map(notice_index.get, changed_ids) if notice is not None]
+    removed = notice_index.removed_since(seq_before)
+    events = [(notice["seq"], "notice", {"kind": "updated" if notice["id"] in existed else "new", "notice": notice})
+              for notice in changed]
+    events.extend((entry["seq"], "removed", entry) for entry in removed)
+    events.sort(key=lambda event: event[0])
+    for seq, event, data in events:
+        broadcaster.publish(event, data, event_id=seq)
+    return len(events)
+
+def apply_crawl_result(source_key, data, tags):
+    """크롤링 결과를 캐시에 병합하고 로그 출력. (신규 건수, 상태변경 건수) 반환"""
+    with cache_lock:
+        # 기존 데이터와 병합
+        existing_data = cache[source_key]["data"]
+        existing_ids = {n["id"] for n in existing_data}
+        seq_before = change_seq
+        with CRAWL_STAGE_SECONDS.time(source=source_key, stage="merge"):
+            data = drop_retired(source_key, data)
+            merged_data, new_count, upd_count, status_changed = merge_notices(existing_data, data, source_key)
+        
+        # 보존 기준을 벗어난 공지는 아카이브로 (바로 빠진 신규 공지는 신규로 세지 않음)
+        merged_data = enforce_retention(source_key, merged_data)
+        new_count = sum(1 for n in merged_data if n["id"] not in existing_ids)
+        
+        # 태그 병합
+        existing_tags = set(cache[source_key]["tags"])
+        existing_tags.update(tags)
+        
+        cache[source_key]["data"] = merged_data
+        cache[source_key]["tags"] = list(existing_tags)
+        cache[source_key]["last_updated"] = datetime.now().isoformat()
+        source_versions[source_key] += 1
+        
+        changed_ids, existed = collect_changes(merged_data, seq_before)
+        
+        index_source(source_key)
+        dirty_sources.add(source_key)
+        
+        changed = publish_changes(changed_ids, existed, seq_before)
+        if changed:
+            broadcaster.publish("summary", {
+                "source": source_key,
+                "newCount": new_count,
+                "statusChangedCount": status_changed
+            })
     
-    print(f"[{datetime.now()}] 캐시 업데이트 시작...")
+    # 로그 출력
+    log_msg = f"[{datetime.now()}] {SOURCES[source_key]['name']} 캐시 업데이트: 총 {len(merged_data)}건 (신규 {new_count}건"
+    if source_key == "cando" and status_changed > 0:
+        log_msg += f", 상태변경 {status_changed}건"
+    log_msg += ")"
+    print(log_msg)
     
-    consecutive_failures = 0
-    max_failures = 3
-    updated_count = 0
-    total_new = 0
-    total_status_changed = 0
+    return new_count, status_changed
+
+def update_source(source_key, cycle_known=None, seen=None):
+    """소스 하나를 크롤링하고 캐시에 병합. (성공 여부, 신규 건수, 상태변경 건수) 반환
     
-    for source_key in SOURCES:
-        try:
-            data, tags = crawl_source(source_key)
-            if data is not None:
-                with cache_lock:
-                    # 기존 데이터와 병합
-                    existing_data = cache[source_key]["data"]
-                    merged_data, new_count, upd_count, status_changed = merge_notices(existing_data, data, source_key)
-                    
-                    # ID 재할당 (병합 후 순서 정리)
-                    for i, notice in enumerate(merged_data):
-                        notice["id"] = f"{source_key}-{i + 1}"
-                    
-                    # 태그 병합
-                    existing_tags = set(cache[source_key]["tags"])
-                    existing_tags.update(tags)
-                    
-                    cache[source_key]["data"] = merged_data
-                    cache[source_key]["tags"] = list(existing_tags)
-                    cache[source_key]["last_updated"] = datetime.now().isoformat()
-                
-                # 로그 출력
-                log_msg = f"[{datetime.now()}] {SOURCES[source_key]['name']} 캐시 업데이트: 총 {len(merged_data)}건 (신규 {new_count}건"
-                if source_key == "cando" and status_changed > 0:
-                    log_msg += f", 상태변경 {status_changed}건"
-                log_msg += ")"
-                print(log_msg)
-                
-                consecutive_failures = 0
-                updated_count += 1
-                total_new += new_count
-                total_status_changed += status_changed
-            else:
-                consecutive_failures += 1
-        except Exception as e:
-            print(f"[ERROR] {source_key} 업데이트 실패: {e}")
-            consecutive_failures += 1
-        
+    seen이 주어지면 크롤링한 공지의 (제목, 링크)를 채운다 (전체 게시판 → 카테고리 게시판 증분 기준).
+    현재 스레드의 연속 실패 횟수를 세고, 한도에 도달하면 풀의 대기 중인 브라우저를 교체한다.
+    """
+    success, new_count, status_changed, error = False, 0, 0, None
+    refresh_jobs.source_started(source_key)
+    try:
+        with CRAWL_DURATION_SECONDS.time(source=source_key):
+            data, tags = crawl_source(source_key, cycle_known)
+        if data is not None:
+            if seen is not None:
+                seen.update((n["title"], n["link"]) for n in data)
+            new_count, status_changed = apply_crawl_result(source_key, data, tags)
+            success = True
+            # 다른 소스를 기다리지 않고 바로 /api/all에 반영
+            build_all_snapshot()
+        else:
+            error = "재시도 후에도 크롤링 결과 없음"
+    except Exception as e:
+        error = str(e)
+        print(f"[ERROR] {source_key} 업데이트 실패: {e}")
+    refresh_jobs.source_finished(source_key, success, new_count, status_changed, error)
+    
+    CRAWL_RESULTS.inc(source=source_key, result="success" if success else "failure")
+    if success:
+        CRAWL_NEW_NOTICES.inc(new_count, source=source_key)
+        worker_local.consecutive_failures = 0
+    else:
+        worker_local.consecutive_failures = getattr(worker_local, "consecutive_failures", 0) + 1
         # 연속 실패 시 드라이버 재생성
-        if consecutive_failures >= max_failures:
-            print(f"[WARNING] 연속 {max_failures}회 실패, 드라이버 재생성 중...")
-            reset_scraper()
-            consecutive_failures = 0
+        if worker_local.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            print(f"[WARNING] 연속 {MAX_CONSECUTIVE_FAILURES}회 실패, 드라이버 재생성 중...")
+            CONSECUTIVE_FAILURE_EVENTS.inc(source=source_key)
+            scraper_pool.reset()
+            worker_local.consecutive_failures = 0
+    
+    return success, new_count, status_changed
+
+def _init_crawl_worker():
+    """병렬 크롤링 워커 스레드 초기화 (스크래퍼는 풀에서 소스마다 대여)"""
+    worker_local.consecutive_failures = 0
+
+def update_cache(source_keys=None):
+    """캐시 업데이트 (기존 데이터 유지, 새 데이터 병합). source_keys가 없으면 전체 소스"""
+    source_keys = list(source_keys or SOURCES)
+    print(f"[{datetime.now()}] 캐시 업데이트 시작... ({', '.join(source_keys)})")
+    
+    results = {}
+    worker_local.consecutive_failures = 0
+    rest = [k for k in source_keys if k != "main"]
+    cycle_known = None
+    if "main" in source_keys:
+        # 전체 게시판을 끝까지 받은 뒤 카테고리 게시판 시작 (이번에 받은 글만 있는 페이지에서 일찍 멈춤)
+        main_seen = set()
+        results["main"] = update_source("main", seen=main_seen)
+        cycle_known = main_seen or None
+    board_known = {k: cycle_known if k in HOSEO_BOARD_SOURCES else None for k in rest}
     
-    # 캐시를 JSON 파일로 저장
+    if CRAWL_WORKERS > 1 and len(rest) > 1:
+        # 소스별 병렬 크롤링 (전체 소요 시간 ≈ 가장 느린 소스)
+        with ThreadPoolExecutor(max_workers=CRAWL_WORKERS, thread_name_prefix="crawler",
+                                initializer=_init_crawl_worker) as executor:
+            futures = {executor.submit(update_source, k, board_known[k]): k for k in rest}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    else:
+        for source_key in rest:
+            results[source_key] = update_source(source_key, board_known[source_key])
+    
+    # 결과에 따라 소스별 다음 크롤링 시각 조정
+    for source_key, (success, new_count, status_changed) in results.items():
+        crawl_scheduler.record(source_key, success, new_count + status_changed)
+    
+    updated_count = sum(1 for success, _, _ in results.values() if success)
+    total_new = sum(new_count for _, new_count, _ in results.values())
+    total_status_changed = sum(status_changed for _, _, status_changed in results.values())
+    
+    # 캐시 저장
     if updated_count > 0:
-        save_cache_to_file()
+        save_cache()
+    if publish_snapshots:
+        publish_snapshot()
     
     # 최종 로그
-    final_log = f"[{datetime.now()}] 캐시 업데이트 완료! ({updated_count}/{len(SOURCES)} 소스, 신규 {total_new}건"
+    final_log = f"[{datetime.now()}] 캐시 업데이트 완료! ({updated_count}/{len(source_keys)} 소스, 신규 {total_new}건"
     if total_status_changed > 0:
         final_log += f", 상태변경 {total_status_changed}건"
     final_log += ")"
     print(final_log)
 
 def background_crawler():
-    """백그라운드에서 주기적으로 크롤링"""
-    global is_running
-    
+    """스케줄러에서 예정 시각이 된 소스만 골라 크롤링"""
     time.sleep(2)
-    update_cache()
     
     while is_running:
-        time.sleep(CACHE_UPDATE_INTERVAL)
-        if is_running:
-            update_cache()
+        due_sources = crawl_scheduler.pop_due()
+        if due_sources:
+            update_cache(due_sources)
+            continue
+        
+        wait_seconds = crawl_scheduler.seconds_until_next()
+        crawl_scheduler.wait(wait_seconds if wait_seconds is not None else CACHE_UPDATE_INTERVAL)
 
-def start_background_crawler():
-    """백그라운드 크롤러 시작"""
-    global background_thread
+def start_background_crawler(publish=False):
+    """백그라운드 크롤러 시작 (publish=True면 크롤링 주기마다 API 워커용 스냅샷 발행)"""
+    global background_thread, publish_snapshots
+    publish_snapshots = publish
     
-    # 먼저 캐시 파일에서 로드 시도
-    cache_loaded = load_cache_from_file()
+    # 먼저 저장된 캐시 로드 시도
+    cache_loaded = load_cache()
+    load_archived_keys()
+    
+    # 빈 소스·오래된 소스부터 크롤링하도록 스케줄 구성
+    with cache_lock:
+        last_updated = {k: cache[k]["last_updated"] for k in SOURCES}
+        counts = {k: len(cache[k]["data"]) for k in SOURCES}
+    crawl_scheduler.seed(last_updated, counts)
+    if publish_snapshots:
+        # 첫 크롤링이 끝나기 전에도 API 워커가 저장된 캐시를 제공하도록
+        publish_snapshot()
+    
+    # 첫 크롤링 전에 브라우저를 미리 띄워 둠 (브라우저로 크롤링하는 소스가 없으면 도서관 재시도 등 필요할 때만)
+    pool_size = browser_pool_size()
+    scraper_pool.size = max(pool_size, 1)
+    scraper_pool.lazy = pool_size == 0
+    if pool_size:
+        threading.Thread(target=scraper_pool.warm_up, name="driver-warmup", daemon=True).start()
     
     background_thread = threading.Thread(target=background_crawler, daemon=True)
     background_thread.start()
     
     if cache_loaded:
         print(f"[{datetime.now()}] 기존 캐시 로드됨, 백그라운드에서 업데이트 진행")
-    print(f"[{datetime.now()}] 백그라운드 크롤러 시작됨 (업데이트 주기: {CACHE_UPDATE_INTERVAL}초)")
+    print(f"[{datetime.now()}] 백그라운드 크롤러 시작됨 (기본 주기: {CACHE_UPDATE_INTERVAL}초, 소스별 자동 조정)")
 
 def shutdown_handler():
     """종료 시 정리"""
     global is_running
     is_running = False
-    save_cache_to_file()  # 종료 전 캐시 저장
-    close_scraper()
+    crawl_scheduler.wake()
+    if crawler_mode == "embedded":
+        save_cache()  # 종료 전 캐시 저장
+    elif snapshot_reader is not None:
+        # 읽기만 하는 API 워커는 저장하지 않음 (크롤러 프로세스가 저장)
+        snapshot_reader.close()
+    scraper_pool.close()
+    if store is not None:
+        store.close()
     print("서버 종료 처리 완료")
 
 atexit.register(shutdown_handler)
 
 # ===== API 엔드포인트 =====
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """API 응답 시간과 크기 기록 (SSE 스트림은 크기 제외)"""
+    started = g.get("request_started")
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        API_REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint=endpoint,
+                                    method=request.method, status=response.status_code)
+        if not response.is_streamed:
+            API_RESPONSE_BYTES.observe(response.calculate_content_length() or 0, endpoint=endpoint)
+    return response
+
 
 @app.route('/api/sources', methods=['GET'])
 def get_sources():
@@ -371,56 +1020,243 @@ def get_sources():
 
 @app.route('/api/all', methods=['GET'])
 def get_all_notices():
-    """전체 공지사항 통합 API"""
-    all_notices = []
-    all_tags = set()
-    source_counts = {}
+    """전체 공지사항 통합 API (미리 만들어 둔 스냅샷을 그대로 전송, limit이 있으면 최신 N건만)"""
+    if request.args.get("limit"):
+        try:
+            limit = min(max(int(request.args["limit"]), 1), 1000)
+        except ValueError:
+            return jsonify({"success": False, "error": "limit은 정수여야 합니다."}), 400
+        with cache_lock:
+            feed = iter_feed()
+            notices = list(itertools.islice(feed, limit))
+            has_more = next(feed, None) is not None
+            token = str(change_seq)
+        return jsonify({"success": True, "notices": notices, "hasMore": has_more, "token": token, "cached": True})
+    
+    snapshot = all_snapshot or build_all_snapshot()
+    
+    # gzip 본문과 원본은 바이트가 다르므로 ETag도 따로 (strong ETag는 표현마다 달라야 함)
+    use_gzip = "gzip" in request.accept_encodings
+    etag = snapshot["etag"] + "-gz" if use_gzip else snapshot["etag"]
+    
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    elif use_gzip:
+        response = Response(snapshot["gzip"], mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(snapshot["body"], mimetype="application/json")
+    
+    response.set_etag(etag)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+@app.route('/api/notices', methods=['GET'])
+def query_notices():
+    """조건별 공지사항 조회 API (source, tag, q, since, limit, cursor)"""
+    source = request.args.get("source") or None
+    if source and source not in SOURCES:
+        return jsonify({"success": False, "error": f"알 수 없는 소스: {source}"}), 400
     
+    try:
+        limit = min(max(int(request.args.get("limit", 20)), 1), 100)
+        with cache_lock:
+            notices, next_cursor = notice_index.query(
+                source=source,
+                tag=request.args.get("tag") or None,
+                q=request.args.get("q") or None,
+                since=request.args.get("since") or None,
+                limit=limit,
+                cursor=request.args.get("cursor") or None
+            )
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    
+    return jsonify({
+        "success": True,
+        "notices": notices,
+        "nextCursor": next_cursor
+    })
+
+@app.route('/api/archive', methods=['GET'])
+def query_archive():
+    """보존 기간이 지난 공지 조회 API (source, q, limit, offset). 지난 공지를 명시적으로 찾을 때만 사용"""
+    source = request.args.get("source") or None
+    if source and source not in SOURCES:
+        return jsonify({"success": False, "error": f"알 수 없는 소스: {source}"}), 400
+    
+    try:
+        limit = min(max(int(request.args.get("limit", 50)), 1), 200)
+        offset = max(int(request.args.get("offset", 0)), 0)
+    except ValueError:
+        return jsonify({"success": False, "error": "limit과 offset은 정수여야 합니다."}), 400
+    
+    try:
+        notices, has_more = get_store().query_archive(source=source, q=request.args.get("q") or None,
+                                                      limit=limit, offset=offset)
+    except sqlite3.Error as e:
+        # 읽기 전용 프로세스에서 DB가 아직 없는 경우 등
+        return jsonify({"success": False, "error": f"아카이브를 읽을 수 없습니다: {e}"}), 503
+    return jsonify({
+        "success": True,
+        "notices": notices,
+        "hasMore": has_more,
+        "nextOffset": offset + len(notices) if has_more else None
+    })
+
+@app.route('/api/notice/<notice_id>/body', methods=['GET'])
+def get_notice_body(notice_id):
+    """공지 본문·첨부파일 (처음 요청 시 상세 페이지에서 가져와 캐시)"""
     with cache_lock:
-        for source_key in SOURCES:
-            source_data = cache[source_key]["data"]
-            source_tags = cache[source_key]["tags"]
-            
-            all_notices.extend(source_data)
-            all_tags.update(source_tags)
-            source_counts[source_key] = len(source_data)
+        notice = notice_index.get(notice_id)
+    if notice is None:
+        return jsonify({"success": False, "error": f"알 수 없는 공지: {notice_id}"}), 404
     
-    # 날짜 기준 정렬 (최신순)
-    def parse_date(notice):
-        date_str = notice.get("date", "")
-        try:
-            # YYYY.MM.DD 또는 YYYY-MM-DD 형식
-            clean_date = date_str.replace(".", "-").replace("/", "-")
-            return clean_date
-        except:
-            return "0000-00-00"
+    try:
+        entry, origin = body_cache.get(notice)
+    except Exception as e:
+        print(f"[ERROR] 본문 가져오기 실패 ({notice_id}): {e}")
+        return jsonify({"success": False, "error": f"본문을 가져오지 못했습니다: {e}"}), 502
     
-    all_notices.sort(key=parse_date, reverse=True)
+    return jsonify({
+        "success": True,
+        "id": notice_id,
+        "link": notice.get("link"),
+        "text": entry["text"],
+        "attachments": entry["attachments"],
+        "fetchedAt": datetime.fromtimestamp(entry["fetched_at"]).isoformat(),
+        "cache": origin
+    })
+
+@app.route('/api/changes', methods=['GET'])
+def get_changes():
+    """since 토큰 이후 추가·변경된 공지와 삭제된(아카이브로 옮긴) 공지 ID만 반환하는 API (캔두 상태 변경 포함)"""
+    try:
+        since = int(request.args.get("since", 0))
+        limit = min(max(int(request.args.get("limit", 500)), 1), 1000)
+    except ValueError:
+        return jsonify({"success": False, "error": "since와 limit은 정수여야 합니다."}), 400
+    
+    with cache_lock:
+        # 서버 캐시가 초기화되어 토큰이 현재 순번보다 크거나, 토큰 이후 삭제 기록 일부가 이미 버려졌으면
+        # 전체를 다시 받도록 안내
+        reset = since > change_seq or since < notice_index.removed_floor
+        if reset:
+            since = 0
+        notices, removed, last_seq, has_more = notice_index.changes(since, limit)
+        token = str(last_seq if has_more else max(last_seq, change_seq))
     
     return jsonify({
         "success": True,
-        "notices": all_notices,
-        "tags": list(all_tags),
-        "sources": SOURCES,
-        "sourceCounts": source_counts,
-        "cached": True
+        "notices": notices,
+        "removed": removed,
+        "token": token,
+        "hasMore": has_more,
+        "reset": reset
+    })
+
+def _replay_changes(since):
+    """since 이후 변경·삭제를 인덱스에서 읽어 SSE 메시지로 반환. (메시지 목록, 마지막 순번)"""
+    messages = []
+    has_more = True
+    while has_more:
+        with cache_lock:
+            notices, removed, since, has_more = notice_index.changes(since)
+        events = [(notice["seq"], "notice", {"kind": "replay", "notice": notice}) for notice in notices]
+        events.extend((entry["seq"], "removed", entry) for entry in removed)
+        for seq, event, data in sorted(events, key=lambda event: event[0]):
+            messages.append(format_event(event, data, seq))
+    return messages, since
+
+@app.route('/api/stream', methods=['GET'])
+def stream_notices():
+    """새 공지·상태 변경을 실시간으로 전달하는 SSE API (Last-Event-ID로 이어받기)"""
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("lastEventId")
+    try:
+        sent = int(last_event_id) if last_event_id else None
+    except ValueError:
+        sent = None
+    
+    # 이어받기 중 놓치는 이벤트가 없도록 먼저 구독한 뒤 인덱스에서 밀린 변경을 읽는다
+    subscriber = broadcaster.subscribe()
+    replay = sent is not None
+    if not replay:
+        with cache_lock:
+            sent = change_seq
+    
+    def generate():
+        nonlocal sent
+        try:
+            yield "retry: 5000\n\n"
+            if replay:
+                messages, sent = _replay_changes(sent)
+                yield from messages
+            
+            while is_running:
+                if subscriber.lagging:
+                    subscriber.drain()
+                    messages, sent = _replay_changes(sent)
+                    yield from messages
+                    continue
+                
+                try:
+                    event_id, event, data = subscriber.queue.get(timeout=STREAM_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ": heartbeat\n\n"
+                    continue
+                
+                if event_id is not None:
+                    if event_id <= sent:
+                        continue
+                    sent = event_id
+                yield format_event(event, data, event_id)
+        finally:
+            broadcaster.unsubscribe(subscriber)
+    
+    return Response(generate(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
     })
 
 @app.route('/api/refresh', methods=['POST'])
 def force_refresh():
-    """강제 캐시 갱신 API"""
-    try:
-        update_cache()
-        return jsonify({
-            "success": True,
-            "message": "캐시 갱신 완료"
-        })
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    """강제 캐시 갱신 API (source로 소스 지정, 없으면 전체). 갱신 작업을 등록하고 작업 ID를 바로 반환"""
+    if crawler_mode == "external":
+        return jsonify({"success": False, "error": "크롤러 프로세스(crawler.py)가 갱신을 담당합니다."}), 409
+    if crawler_mode == "off":
+        return jsonify({"success": False, "error": "읽기 전용 모드에서는 크롤링하지 않습니다."}), 409
+    
+    # ?source=main,academic 또는 {"sources": ["main", "academic"]}
+    body = request.get_json(silent=True) or {}
+    source_keys = body.get("sources") or [k for k in request.args.get("source", "").split(",") if k]
+    unknown = [k for k in source_keys if k not in SOURCES]
+    if unknown:
+        return jsonify({"success": False, "error": f"알 수 없는 소스: {', '.join(map(str, unknown))}"}), 400
+    
+    job, coalesced = refresh_jobs.submit(source_keys or list(SOURCES))
+    response = jsonify({
+        "success": True,
+        "jobId": job["id"],
+        "coalesced": coalesced,
+        "job": job
+    })
+    response.status_code = 202
+    response.headers["Location"] = f"/api/refresh/{job['id']}"
+    return response
+
+@app.route('/api/refresh/<job_id>', methods=['GET'])
+def get_refresh_job(job_id):
+    """갱신 작업 진행 상황과 소스별 결과"""
+    job = refresh_jobs.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": f"알 수 없는 작업: {job_id}"}), 404
+    return jsonify({"success": True, "job": job})
 
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """서버 상태 및 캐시 정보"""
+    archived = archived_counts()
     with cache_lock:
         cache_info = {}
         for source_key in SOURCES:
@@ -431,29 +1267,65 @@ def get_status():
             }
         
         # 캐시 파일 정보
-        cache_file_exists = os.path.exists(CACHE_FILE_PATH)
-        cache_file_size = os.path.getsize(CACHE_FILE_PATH) if cache_file_exists else 0
-        cache_file_modified = datetime.fromtimestamp(os.path.getmtime(CACHE_FILE_PATH)).isoformat() if cache_file_exists else None
+        cache_file_path = DB_PATH if STORAGE_BACKEND == "sqlite" else CACHE_SNAPSHOT_PATH
+        cache_file_exists = os.path.exists(cache_file_path)
+        cache_file_size = os.path.getsize(cache_file_path) if cache_file_exists else 0
+        cache_file_modified = datetime.fromtimestamp(os.path.getmtime(cache_file_path)).isoformat() if cache_file_exists else None
+        
+        # 크롤링하지 않는 프로세스는 스냅샷에 담겨 온 크롤러 프로세스의 스케줄·브라우저 풀 상태를 보여 줌
+        if crawler_mode != "embedded":
+            schedule = (crawler_status or {}).get("schedule")
+            driver_pool = (crawler_status or {}).get("driverPool")
+        else:
+            schedule, driver_pool = crawl_scheduler.status(), scraper_pool.status()
         
         return jsonify({
             "status": "ok",
             "cache": cache_info,
             "cacheFile": {
-                "path": CACHE_FILE_PATH,
+                "backend": STORAGE_BACKEND,
+                "path": cache_file_path,
                 "exists": cache_file_exists,
                 "size": cache_file_size,
                 "lastModified": cache_file_modified
             },
             "settings": {
-                "update_interval_seconds": CACHE_UPDATE_INTERVAL
-            }
+                "update_interval_seconds": CACHE_UPDATE_INTERVAL,
+                "crawl_workers": CRAWL_WORKERS,
+                "retention_max_age_days": RETENTION_MAX_AGE_DAYS,
+                "retention_max_count": RETENTION_MAX_COUNT
+            },
+            "archive": {
+                "pending": sum(len(v) for v in pending_archive.values()),
+                "stored": archived
+            },
+            "crawlerMode": crawler_mode,
+            "crawler": crawler_status,
+            "schedule": schedule,
+            "driverPool": driver_pool,
+            "bodyCache": body_cache.status(),
+            "refreshJobs": refresh_jobs.status(),
+            "streamSubscribers": len(broadcaster)
         })
 
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus 텍스트 형식 메트릭"""
+    with cache_lock:
+        for source_key in SOURCES:
+            CACHED_NOTICES.set(len(cache[source_key]["data"]), source=source_key)
+    STREAM_SUBSCRIBERS.set(len(broadcaster))
+    pool_status = scraper_pool.status()
+    for state in ("idle", "leased"):
+        DRIVER_POOL.set(pool_status[state], state=state)
+    DRIVER_POOL.set(1 if pool_status["spare_ready"] else 0, state="spare")
+    return Response(REGISTRY.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """서버 상태 확인"""
     return jsonify({"status": "ok"})
 
 if __name__ == '__main__':
-    start_background_crawler()
+    start_server()
     app.run(debug=False, port=5000, threaded=True)
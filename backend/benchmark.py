@@ -0,0 +1,358 @@
+"""저장된 HTML 픽스처로 파서 성능 측정 (학교 사이트 접속 없음)
+
+mainpg.html / lib.html / cando_page.html을 로컬 HTTP 서버에서 제공하고
+소스·추출 방식별 처리량(rows/s, ms/page)과 최대 메모리(tracemalloc)를 잰다.
+benchmark_baseline.json과 비교해 느려지거나 메모리가 늘거나 추출 행 수가 바뀌면 실패(종료 코드 1).
+
+시간은 기기마다 다르므로 고정된 보정 루프의 실행 시간에 대한 비율로 비교한다.
+기준값을 저장할 때 보정 시간도 함께 저장하고, 비교할 때는 기준값의 ms/page를 현재 기기의
+보정 시간에 맞게 환산한다. 기기별 기준값 파일을 따로 두려면 --baseline 또는
+NOTICE_BENCH_BASELINE, 허용 오차는 --tolerance 또는 NOTICE_BENCH_TOLERANCE로 지정한다.
+
+    python benchmark.py                    # 기준값과 비교
+    python benchmark.py --update-baseline  # 현재 결과를 기준값으로 저장
+    python benchmark.py --only main        # 이름에 'main'이 들어간 항목만
+    python benchmark.py --baseline ci_baseline.json --tolerance 1.0
+
+브라우저 항목은 Chrome을 실행할 수 없으면 건너뛴다.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from bs4 import BeautifulSoup
+
+import scraper
+from scraper import (NoticeScraper, parse_bbs_list, parse_cando_card,
+                     BBS_LIST_EXTRACT_JS, LIBRARY_EXTRACT_JS, CANDO_EXTRACT_JS)
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BACKEND_DIR)
+FIXTURES = {
+    "main": os.path.join(ROOT_DIR, "mainpg.html"),
+    "library": os.path.join(ROOT_DIR, "lib.html"),
+    "cando": os.path.join(BACKEND_DIR, "cando_page.html"),
+}
+BASELINE_PATH = os.environ.get("NOTICE_BENCH_BASELINE",
+                               os.path.join(BACKEND_DIR, "benchmark_baseline.json"))
+CALIBRATION_KEY = "_calibration"  # 기준값 파일에서 측정 항목이 아닌 보정 시간 항목
+
+DEFAULT_ITERATIONS = 20
+# 기준값 대비 50% 넘게 느려지거나 메모리가 늘면 실패
+DEFAULT_TOLERANCE = float(os.environ.get("NOTICE_BENCH_TOLERANCE", "0.5"))
+CALIBRATION_ROUNDS = 5
+MAIN_PAGES = 5  # 호서대 게시판 페이지 수 (실제 크롤링 MAIN_PAGE_END와 비슷하게)
+CANDO_CARD_PAGES = 50  # 카드 변환은 페이지당 시간이 너무 짧아 여러 페이지 분량을 한 번에 측정
+
+
+def read_fixture(name):
+    with open(FIXTURES[name], "rb") as f:
+        return f.read()
+
+
+def library_rows(count):
+    """lib.html의 행 하나를 글 번호만 바꿔 count개로 복제 (도서관 목록 max=200 재현)"""
+    row = read_fixture("library").decode("utf-8")
+    match = re.search(r"#/bbs/notice/(\d+)", row)
+    first_id = int(match.group(1)) if match else 8000
+    return [row.replace(match.group(0), f"#/bbs/notice/{first_id - i}") if match else row
+            for i in range(count)]
+
+
+def library_page():
+    """도서관 목록 페이지 (행 LIBRARY_MAX_ARTICLES개)"""
+    return ("<html><head><meta charset='utf-8'></head><body><table><tbody>"
+            + "".join(library_rows(scraper.LIBRARY_MAX_ARTICLES))
+            + "</tbody></table></body></html>")
+
+
+def cando_cards(html):
+    """cando_page.html의 카드를 CANDO_EXTRACT_JS가 돌려주는 dict 형태로 (측정 입력 준비용, 측정 대상 아님)"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    def text(card, selector):
+        el = card.select_one(selector)
+        return el.get_text(strip=True) if el else None
+
+    cards = []
+    for card in soup.select(".prod-list"):
+        link = card.find("a")
+        item = card.find_parent(attrs={"onclick": True})
+        cards.append({
+            "onclick": item.get("onclick") if item else None,
+            "title": text(card, ".prod1.text-info, [id$='_Title_txt']"),
+            "href": link.get("href") if link else None,
+            "absoluteHref": None,
+            "dateText": text(card, "[id$='_DateTime_txt'], .prod2"),
+            "statusText": text(card, "[name='finishDate'], [id$='_finishDate'], .label.label-white span"),
+            "labels": [el.get_text(strip=True) for el in card.select(".label")]
+        })
+    return cards
+
+
+def library_articles():
+    """lib.html 행을 도서관 API 응답의 게시글 형태로 변환"""
+    soup = BeautifulSoup(read_fixture("library"), "html.parser")
+    title = soup.select_one("[ng-bind='noticeArticle.title']").get_text(strip=True)
+    date = next(span.get_text(strip=True) for span in soup.find_all("span")
+                if re.match(r"\d{4}\.\d{2}\.\d{2}", span.get_text(strip=True)))
+    first_id = int(re.search(r"#/bbs/notice/(\d+)", soup.select_one("a.ikc-item-title")["href"]).group(1))
+    year, month, day = date.split(".")
+    return [{"id": first_id - i, "title": title, "dateCreated": f"{year}-{month}-{day} 09:00:00"}
+            for i in range(scraper.LIBRARY_MAX_ARTICLES)]
+
+
+# ===== 로컬 대역 서버 =====
+class FixtureHandler(BaseHTTPRequestHandler):
+    pages = {}
+    articles = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/library-api":
+            query = parse_qs(url.query)
+            offset = int(query.get("offset", ["0"])[0])
+            size = int(query.get("max", ["20"])[0])
+            body = json.dumps({"success": True, "data": {
+                "totalCount": len(self.articles),
+                "list": self.articles[offset:offset + size]
+            }}, ensure_ascii=False).encode("utf-8")
+            return self._send(body, "application/json; charset=utf-8")
+        for prefix, body in self.pages.items():
+            if url.path.startswith(prefix):
+                return self._send(body, "text/html; charset=utf-8")
+        self.send_error(404)
+
+    def _send(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server():
+    """픽스처 서버를 백그라운드 스레드로 실행하고 기본 URL 반환"""
+    FixtureHandler.pages = {
+        "/Home//BBSList.mbz": read_fixture("main"),
+        "/library": library_page().encode("utf-8"),
+        "/cando": read_fixture("cando"),
+    }
+    FixtureHandler.articles = library_articles()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# ===== 측정 항목 =====
+# 각 항목은 (준비 함수, 실행 함수, 실행 1회당 페이지 수)
+# 실행 함수는 추출한 행 수를 반환한다.
+def make_cases(base_url):
+    # 스크래퍼가 실제 사이트 대신 대역 서버를 호출하도록 주소만 바꿈
+    scraper.HOSEO_BASE_URL = base_url
+    scraper.LIBRARY_API_URL = base_url + "/library-api"
+    main_html = read_fixture("main")
+    cando_card_list = cando_cards(read_fixture("cando"))
+    state = {}
+
+    def http_scraper():
+        state["scraper"] = NoticeScraper(fetch_mode="http")
+
+    def browser_scraper():
+        if state.get("browser_error"):
+            raise RuntimeError(state["browser_error"])  # 브라우저 실행은 한 번만 시도
+        if state.get("browser") is None:
+            s = NoticeScraper(fetch_mode="browser")
+            try:
+                s._ensure_driver()
+            except Exception as e:
+                state["browser_error"] = str(e).splitlines()[0]
+                raise
+            state["browser"] = s
+        state["scraper"] = state["browser"]
+
+    def main_parse():
+        return len(parse_bbs_list(main_html)["제목"])
+
+    def main_http():
+        return len(state["scraper"]._main_category_http("", 1, MAIN_PAGES)["제목"])
+
+    def main_browser():
+        s = state["scraper"]
+        s._get(base_url + "/Home//BBSList.mbz")
+        return len(s._extract(BBS_LIST_EXTRACT_JS))
+
+    def cando_cards_parse():
+        rows = 0
+        for _ in range(CANDO_CARD_PAGES):
+            rows += sum(1 for card in cando_card_list if parse_cando_card(card)[0])
+        return rows
+
+    def library_api():
+        return len(state["scraper"].library(mode="api")["제목"])
+
+    def library_browser():
+        s = state["scraper"]
+        s._get(base_url + "/library")
+        s._wait_for_stable(".ikc-item", 10)
+        return sum(1 for row in s._extract(LIBRARY_EXTRACT_JS) if row["title"] is not None)
+
+    def cando_browser():
+        s = state["scraper"]
+        s._get(base_url + "/cando")
+        s._wait_for_stable(".prod-list", 15)
+        return sum(1 for card in s._extract(CANDO_EXTRACT_JS) if parse_cando_card(card)[0])
+
+    cases = {
+        "main/parse": (lambda: None, main_parse, 1),
+        "main/http": (http_scraper, main_http, MAIN_PAGES),
+        "cando/cards": (lambda: None, cando_cards_parse, CANDO_CARD_PAGES),
+        "library/api": (http_scraper, library_api,
+                        -(-scraper.LIBRARY_MAX_ARTICLES // scraper.LIBRARY_API_PAGE_SIZE)),
+        "main/browser": (browser_scraper, main_browser, 1),
+        "library/browser": (browser_scraper, library_browser, 1),
+        "cando/browser": (browser_scraper, cando_browser, 1),
+    }
+    return cases, state
+
+
+def calibrate():
+    """기기 속도 기준: 고정된 순수 파이썬 작업의 실행 시간(ms, 여러 번 중 최솟값)"""
+    best = None
+    for _ in range(CALIBRATION_ROUNDS):
+        started = time.perf_counter()
+        words = {}
+        for i in range(200000):
+            key = str(i % 997)
+            words[key] = words.get(key, 0) + len(key)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best * 1000, 3)
+
+
+def measure(setup, run, pages, iterations):
+    """워밍업 1회 후 iterations회 반복 측정, 메모리는 별도 1회 측정"""
+    setup()
+    rows = run()
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        run()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "rows": rows,
+        "ms_per_page": round(elapsed * 1000 / (iterations * pages), 3),
+        "rows_per_sec": round(rows * iterations / elapsed, 1) if elapsed else 0,
+        "peak_kb": round(peak / 1024, 1)
+    }
+
+
+def compare(name, result, baseline, tolerance, scale=1.0):
+    """기준값 대비 회귀 목록 (scale: 기준값의 시간을 현재 기기에 맞게 환산하는 보정 비율)"""
+    problems = []
+    if result["rows"] != baseline["rows"]:
+        problems.append(f"추출 행 수 {baseline['rows']} → {result['rows']}")
+    for metric in ("ms_per_page", "peak_kb"):
+        expected = baseline[metric] * scale if metric == "ms_per_page" else baseline[metric]
+        limit = expected * (1 + tolerance)
+        if result[metric] > limit:
+            problems.append(f"{metric} {baseline[metric]} → {result[metric]} (허용 {limit:.1f})")
+    return [f"{name}: {problem}" for problem in problems]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 HTML 픽스처 기반 파서 벤치마크")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--only", help="이름에 이 문자열이 들어간 항목만 실행")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 파일 (기기별로 따로 둘 때)")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    args = parser.parse_args()
+
+    calibration_ms = calibrate()
+    print(f"보정 루프 {calibration_ms:.3f} ms")
+
+    server, base_url = start_fixture_server()
+    cases, state = make_cases(base_url)
+    results = {}
+    try:
+        for name, (setup, run, pages) in cases.items():
+            if args.only and args.only not in name:
+                continue
+            try:
+                results[name] = measure(setup, run, pages, args.iterations)
+            except Exception as e:
+                if name.endswith("/browser"):
+                    print(f"[WARNING] {name} 건너뜀 (브라우저 실행 불가): {str(e).splitlines()[0]}")
+                    continue
+                raise
+            r = results[name]
+            print(f"{name:<18} {r['rows']:>5} rows  {r['ms_per_page']:>9.3f} ms/page  "
+                  f"{r['rows_per_sec']:>10.1f} rows/s  {r['peak_kb']:>9.1f} KB peak")
+    finally:
+        if state.get("browser") is not None:
+            state["browser"].close()
+        server.shutdown()
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        previous_ms = baseline.get(CALIBRATION_KEY, {}).get("ms")
+        if previous_ms and baseline.keys() - {CALIBRATION_KEY} - results.keys():
+            # 이번에 측정하지 않은 항목의 시간도 현재 보정 시간 기준으로 환산해 둠
+            scale = calibration_ms / previous_ms
+            for name in baseline.keys() - {CALIBRATION_KEY} - results.keys():
+                baseline[name]["ms_per_page"] = round(baseline[name]["ms_per_page"] * scale, 3)
+        baseline.update(results)
+        baseline[CALIBRATION_KEY] = {"ms": calibration_ms}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"[INFO] 기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("[WARNING] 기준값 파일이 없습니다. --update-baseline으로 먼저 저장하세요.")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    # 보정 시간이 없는 기준값 파일은 절대 시간으로 비교
+    scale = 1.0
+    baseline_calibration = baseline.get(CALIBRATION_KEY, {}).get("ms")
+    if baseline_calibration:
+        scale = calibration_ms / baseline_calibration
+        print(f"[INFO] 기준 기기 대비 속도 비율 {scale:.2f} (기준 보정 루프 {baseline_calibration:.3f} ms)")
+
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            regressions.extend(compare(name, result, baseline[name], args.tolerance, scale))
+    if regressions:
+        print("[ERROR] 성능 회귀 감지:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+    print("[INFO] 기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
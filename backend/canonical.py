@@ -0,0 +1,55 @@
+"""호서대 게시판 공지 통합
+
+전체 게시판(main)과 카테고리 게시판(학사, 장학 등)에는 같은 글(schIdx)이 여러 번 올라온다.
+소스별 캐시·저장소는 그대로 두고, 조회용으로 글 번호당 하나의 공지를 만들어
+어느 게시판에 올라왔는지를 categories로 붙인다.
+"""
+from notice_ids import make_notice_id
+
+HOSEO_BOARD_SOURCES = ("main", "fusion", "academic", "scholarship", "volunteer", "external", "career")
+CANONICAL_GROUP = "hoseo"
+
+
+def canonical_notice_id(notice):
+    """조회용 공지 ID (호서대 게시판 공지는 게시판과 무관하게 글 번호로)"""
+    if notice.get("source") in HOSEO_BOARD_SOURCES:
+        return make_notice_id(CANONICAL_GROUP, notice["articleId"])
+    return notice["id"]
+
+
+class CanonicalNotices:
+    def __init__(self, source_order):
+        # 대표 소스는 카테고리 게시판을 먼저, 전체 게시판(main)은 마지막에
+        board_order = [s for s in source_order if s in HOSEO_BOARD_SOURCES and s != "main"] + ["main"]
+        self._rank = {source: i for i, source in enumerate(board_order)}
+        self._members = {}    # 글 번호 -> {소스: 소스별 공지}
+        self._by_source = {}  # 소스 -> 글 번호 집합
+
+    def update_source(self, source, notices):
+        """소스 하나의 공지 목록 반영 (목록에서 빠진 글은 해당 소스 소속에서 제외)"""
+        current = {notice["articleId"]: notice for notice in notices}
+        for article_id in self._by_source.get(source, set()) - current.keys():
+            members = self._members.get(article_id, {})
+            members.pop(source, None)
+            if not members:
+                self._members.pop(article_id, None)
+        for article_id, notice in current.items():
+            self._members.setdefault(article_id, {})[source] = notice
+        self._by_source[source] = set(current)
+
+    def notice(self, article_id):
+        """글 번호 하나의 통합 공지 (대표 소스의 공지에 소속 게시판·태그·최신 순번을 합침)"""
+        members = self._members[article_id]
+        sources = sorted(members, key=self._rank.get)
+        merged = dict(members[sources[0]])
+        merged["id"] = make_notice_id(CANONICAL_GROUP, article_id)
+        merged["categories"] = sources
+        merged["tags"] = list(dict.fromkeys(tag for source in sources for tag in members[source].get("tags", [])))
+        merged["seq"] = max(n.get("seq", 0) for n in members.values())
+        return merged
+
+    def notices(self):
+        return [self.notice(article_id) for article_id in self._members]
+
+    def __len__(self):
+        return len(self._members)
@@ -0,0 +1,34 @@
+"""독립 크롤러 프로세스
+
+API 워커(wsgi.py, 또는 NOTICE_CRAWLER_MODE=external로 실행한 app.py)와 따로 실행한다.
+리더 락을 잡은 프로세스 하나만 크롤링하고, 크롤링 주기마다 캐시를 저장한 뒤 공유 스냅샷을 발행한다.
+락을 못 잡은 프로세스는 대기하다가 리더가 종료되면 이어받는다.
+
+    python crawler.py
+"""
+import time
+from datetime import datetime
+
+import app as notice_app
+from leader_lock import LeaderLock
+
+
+def main():
+    # 락은 프로세스가 끝날 때 풀리므로 종료 시 캐시 저장(atexit)이 끝난 뒤에 다음 리더가 시작한다
+    lock = LeaderLock(notice_app.CRAWLER_LOCK_PATH)
+    if not lock.acquire():
+        print(f"[{datetime.now()}] 다른 크롤러가 실행 중 (PID {lock.holder_pid()}), 대기 모드")
+        while not lock.acquire():
+            time.sleep(notice_app.LEADER_RETRY_SECONDS)
+    print(f"[{datetime.now()}] 리더 락 획득, 크롤링 시작")
+
+    notice_app.start_background_crawler(publish=True)
+    try:
+        while notice_app.background_thread.is_alive():
+            notice_app.background_thread.join(timeout=1)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
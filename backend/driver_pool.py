@@ -0,0 +1,216 @@
+"""NoticeScraper 풀
+
+브라우저가 필요한 크롤링에는 미리 띄워 둔 드라이버를 빌려주고, 예비 인스턴스 하나를
+항상 준비해 두어 크롤링 도중 브라우저가 죽어도 콜드 스타트 없이 교체한다.
+일정 페이지 수를 열었거나 메모리(RSS)가 한도를 넘은 인스턴스는 반납 시 교체한다.
+HTTP만 쓰는 크롤링에는 드라이버 없는 스크래퍼를 빌려준다.
+lazy 풀은 미리 띄우지 않고 브라우저가 필요할 때만 띄우며 예비 인스턴스도 두지 않는다.
+"""
+import threading
+from contextlib import contextmanager
+
+from metrics import DRIVER_RESETS
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 RSS 기준 교체는 하지 않음
+    psutil = None
+
+
+def driver_rss_mb(scraper):
+    """chromedriver와 하위 Chrome 프로세스의 메모리 합계 (MB, 측정 불가 시 0)"""
+    if psutil is None or scraper.driver is None:
+        return 0
+    try:
+        process = psutil.Process(scraper.driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except Exception:
+        return 0
+
+
+def _close_quietly(scraper):
+    try:
+        scraper.close()
+    except Exception:
+        pass
+
+
+class ScraperPool:
+    def __init__(self, factory, size=1, max_page_loads=200, max_rss_mb=1500, lazy=False):
+        self._factory = factory
+        self.size = size
+        self.lazy = lazy
+        self.max_page_loads = max_page_loads
+        self.max_rss_mb = max_rss_mb
+        self._cond = threading.Condition()
+        self._idle = []         # 드라이버가 떠 있는 대기 인스턴스
+        self._http_idle = []    # 드라이버 없는 HTTP 전용 인스턴스
+        self._leased = 0        # 대여 중인 브라우저 인스턴스 수
+        self._spare = None      # 미리 띄워 둔 예비 인스턴스
+        self._spare_launching = False
+        self._discarded = set()
+        self._closed = False
+        self.stats = {"launched": 0, "recycled": 0, "health_failures": 0}
+
+    def _launch(self):
+        """드라이버까지 띄운 새 인스턴스"""
+        scraper = self._factory()
+        scraper._ensure_driver()
+        with self._cond:
+            self.stats["launched"] += 1
+        return scraper
+
+    def warm_up(self):
+        """N개 인스턴스와 예비 인스턴스를 미리 띄움 (백그라운드 스레드에서 호출 권장)"""
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) + self._leased >= self.size:
+                    break
+            try:
+                scraper = self._launch()
+            except Exception as e:
+                print(f"[WARNING] 드라이버 풀 초기화 실패: {e}")
+                return
+            with self._cond:
+                self._idle.append(scraper)
+                self._cond.notify()
+        self._prelaunch_spare()
+
+    def _prelaunch_spare(self):
+        """예비 인스턴스가 없으면 백그라운드에서 띄움"""
+        with self._cond:
+            if self._closed or self.lazy or self._spare is not None or self._spare_launching:
+                return
+            self._spare_launching = True
+
+        def launch():
+            scraper = None
+            try:
+                scraper = self._launch()
+            except Exception as e:
+                print(f"[WARNING] 예비 드라이버 실행 실패: {e}")
+            with self._cond:
+                self._spare_launching = False
+                if scraper is not None and not self._closed:
+                    self._spare = scraper
+                    scraper = None
+            if scraper is not None:
+                _close_quietly(scraper)
+
+        threading.Thread(target=launch, name="driver-spare", daemon=True).start()
+
+    def _replacement(self):
+        """예비 인스턴스를 꺼내고 다음 예비를 준비 (없으면 바로 실행)"""
+        with self._cond:
+            scraper, self._spare = self._spare, None
+        self._prelaunch_spare()
+        return scraper if scraper is not None else self._launch()
+
+    def discard(self, scraper):
+        """세션 오류 등으로 못 쓰게 된 인스턴스를 반납 시 교체하도록 표시"""
+        with self._cond:
+            self._discarded.add(id(scraper))
+
+    def _recycle_reason(self, scraper):
+        """반납된 인스턴스를 교체해야 하는 이유 (계속 써도 되면 None)"""
+        if id(scraper) in self._discarded:
+            return "session_error"
+        if scraper.page_loads >= self.max_page_loads:
+            return "page_loads"
+        if self.max_rss_mb and driver_rss_mb(scraper) >= self.max_rss_mb:
+            return "rss"
+        return None
+
+    @contextmanager
+    def lease(self, browser=True):
+        """인스턴스 대여 (with 블록이 끝나면 반납)"""
+        if not browser:
+            with self._cond:
+                scraper = self._http_idle.pop() if self._http_idle else None
+            scraper = scraper or self._factory()
+            try:
+                yield scraper
+            finally:
+                with self._cond:
+                    if self._closed:
+                        _close_quietly(scraper)
+                    else:
+                        self._http_idle.append(scraper)
+            return
+
+        with self._cond:
+            while not self._idle and self._leased >= self.size:
+                self._cond.wait()
+            scraper = self._idle.pop() if self._idle else None
+            self._leased += 1
+
+        try:
+            # 헬스 체크: 세션이 죽었으면 예비 인스턴스로 교체
+            if scraper is None or not scraper.is_driver_alive():
+                if scraper is not None:
+                    with self._cond:
+                        self.stats["health_failures"] += 1
+                    DRIVER_RESETS.inc(reason="health_check")
+                    _close_quietly(scraper)
+                scraper = self._replacement()
+        except Exception:
+            with self._cond:
+                self._leased -= 1
+                self._cond.notify()
+            raise
+
+        try:
+            yield scraper
+        finally:
+            recycle = self._recycle_reason(scraper)
+            with self._cond:
+                self._discarded.discard(id(scraper))
+                self._leased -= 1
+                closed = self._closed
+                if not recycle and not closed:
+                    self._idle.append(scraper)
+                self._cond.notify()
+            if recycle or closed:
+                _close_quietly(scraper)
+                if recycle and not closed:
+                    DRIVER_RESETS.inc(reason=recycle)
+                    # 예비 인스턴스를 바로 투입하고 다음 예비를 준비
+                    with self._cond:
+                        self.stats["recycled"] += 1
+                        if self._spare is not None:
+                            self._idle.append(self._spare)
+                            self._spare = None
+                            self._cond.notify()
+                    self._prelaunch_spare()
+
+    def reset(self):
+        """대기 중인 브라우저 인스턴스를 모두 교체 (연속 실패 시)"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for scraper in idle:
+            DRIVER_RESETS.inc(reason="consecutive_failures")
+            _close_quietly(scraper)
+        if not self.lazy:
+            threading.Thread(target=self.warm_up, name="driver-warmup", daemon=True).start()
+
+    def status(self):
+        with self._cond:
+            return {
+                "size": self.size,
+                "lazy": self.lazy,
+                "idle": len(self._idle),
+                "leased": self._leased,
+                "spare_ready": self._spare is not None,
+                **self.stats
+            }
+
+    def close(self):
+        """모든 인스턴스 종료 (대여 중인 인스턴스는 반납 시 종료)"""
+        with self._cond:
+            self._closed = True
+            scrapers = self._idle + self._http_idle + ([self._spare] if self._spare else [])
+            self._idle, self._http_idle, self._spare = [], [], None
+            self._cond.notify_all()
+        for scraper in scrapers:
+            _close_quietly(scraper)
@@ -0,0 +1,68 @@
+"""Server-Sent Events 브로드캐스터
+
+병합에서 발견된 새 공지·상태 변경을 구독자마다 있는 제한된 큐에 넣는다.
+발행은 put_nowait만 하므로 느린 구독자가 크롤러를 막지 않는다.
+큐가 가득 찬 구독자는 lagging으로 표시되고, 스트림 쪽에서 마지막으로 보낸 순번부터
+인덱스를 다시 읽어 따라잡는다.
+"""
+import json
+import queue
+import threading
+
+
+class Subscriber:
+    def __init__(self, queue_size):
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.lagging = False
+
+    def drain(self):
+        """밀린 이벤트를 모두 버리고 lagging 해제 (인덱스에서 다시 읽은 뒤 호출)"""
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+        self.lagging = False
+
+
+class EventBroadcaster:
+    def __init__(self, queue_size=256):
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def subscribe(self):
+        subscriber = Subscriber(self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event, data, event_id=None):
+        """모든 구독자에게 이벤트 전달 (가득 찬 큐는 건너뛰고 lagging 표시)"""
+        message = (event_id, event, data)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.lagging:
+                continue
+            try:
+                subscriber.queue.put_nowait(message)
+            except queue.Full:
+                subscriber.lagging = True
+
+
+def format_event(event, data, event_id=None):
+    """SSE 메시지 문자열 생성"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
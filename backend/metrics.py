@@ -0,0 +1,163 @@
+"""Prometheus 텍스트 형식 메트릭
+
+크롤링 단계별 소요 시간(드라이버 실행, 페이지 이동, 요소 대기, 추출, 병합, 저장),
+재시도·드라이버 교체·연속 실패 횟수, API 응답 시간과 크기를 모아 /api/metrics로 내보낸다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록의 소요 시간을 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _render_sample(self, key, state):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, state["counts"]):
+            cumulative += count
+            le = 'le="' + _format_value(bound) + '"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# ===== 크롤링 =====
+CRAWL_STAGE_SECONDS = REGISTRY.register(Histogram(
+    "notice_crawl_stage_seconds",
+    "Time spent per crawl stage (driver_start, navigation, element_wait, extraction, merge, save)",
+    ("source", "stage")))
+CRAWL_DURATION_SECONDS = REGISTRY.register(Histogram(
+    "notice_crawl_duration_seconds", "Total time to crawl one source including retries", ("source",)))
+CRAWL_RESULTS = REGISTRY.register(Counter(
+    "notice_crawl_results_total", "Crawl results per source", ("source", "result")))
+CRAWL_RETRIES = REGISTRY.register(Counter(
+    "notice_crawl_retries_total", "Crawl attempts after the first one", ("source",)))
+CRAWL_NEW_NOTICES = REGISTRY.register(Counter(
+    "notice_crawl_new_notices_total", "New notices found by crawling", ("source",)))
+CONSECUTIVE_FAILURE_EVENTS = REGISTRY.register(Counter(
+    "notice_crawl_consecutive_failure_events_total",
+    "Times a worker hit the consecutive-failure limit", ("source",)))
+DRIVER_RESETS = REGISTRY.register(Counter(
+    "notice_driver_resets_total", "Browser instances replaced, by reason", ("reason",)))
+
+# ===== API =====
+API_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "notice_api_request_seconds", "API request latency", ("endpoint", "method", "status")))
+API_RESPONSE_BYTES = REGISTRY.register(Histogram(
+    "notice_api_response_bytes", "API response payload size", ("endpoint",), buckets=SIZE_BUCKETS))
+
+# ===== 현재 상태 (/api/metrics 요청 시 갱신) =====
+CACHED_NOTICES = REGISTRY.register(Gauge(
+    "notice_cached_notices", "Notices currently cached", ("source",)))
+STREAM_SUBSCRIBERS = REGISTRY.register(Gauge(
+    "notice_stream_subscribers", "Connected /api/stream clients"))
+DRIVER_POOL = REGISTRY.register(Gauge(
+    "notice_driver_pool", "Browser pool instances by state", ("state",)))
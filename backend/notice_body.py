@@ -0,0 +1,125 @@
+"""공지 본문 캐시
+
+상세 페이지 본문은 처음 요청될 때만 가져온다. 가져온 본문은 크기 제한이 있는 메모리 LRU와
+공지 ID별 JSON 파일(TTL)에 보관한다. 같은 공지를 동시에 요청하면 한 번만 가져오고
+나머지 요청은 그 결과를 기다린다.
+"""
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+def _entry_size(entry):
+    """메모리 한도 계산용 대략적인 크기 (바이트)"""
+    return len(entry["text"].encode("utf-8")) + sum(
+        len((a.get("name") or "") + (a.get("url") or "")) for a in entry["attachments"]) + 256
+
+
+class NoticeBodyCache:
+    def __init__(self, fetch, cache_dir, ttl, max_bytes):
+        """fetch(notice) -> {"text", "attachments"}"""
+        self._fetch = fetch
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lru = OrderedDict()  # notice_id -> (entry, 크기) (오래 안 쓴 순)
+        self._bytes = 0
+        self._inflight = {}        # notice_id -> Future
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "fetches": 0, "shared_fetches": 0}
+
+    def get(self, notice):
+        """본문 조회: 메모리 → 디스크 → 상세 페이지 순. (entry, 출처) 반환"""
+        notice_id = notice["id"]
+        with self._lock:
+            entry, _ = self._lru.get(notice_id, (None, 0))
+            if entry is not None and self._fresh(entry, notice):
+                self._lru.move_to_end(notice_id)
+                self.stats["memory_hits"] += 1
+                return entry, "memory"
+            future = self._inflight.get(notice_id)
+            owner = future is None
+            if owner:
+                future = self._inflight[notice_id] = Future()
+            else:
+                self.stats["shared_fetches"] += 1
+
+        if not owner:
+            return future.result(), "shared"
+
+        try:
+            entry, origin = self._read_disk(notice), "disk"
+            if entry is None:
+                entry, origin = self._fetch_and_store(notice), "fetched"
+            self._remember(notice_id, entry)
+            future.set_result(entry)
+            return entry, origin
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(notice_id, None)
+
+    def _fresh(self, entry, notice):
+        """TTL 안이고 지금 공지 링크에서 가져온 본문인지 (링크가 바뀌면 다시 가져옴)"""
+        return time.time() - entry["fetched_at"] <= self.ttl and entry.get("link") == notice.get("link")
+
+    def _path(self, notice_id):
+        return os.path.join(self.cache_dir, re.sub(r"[^\w.-]", "_", notice_id) + ".json")
+
+    def _read_disk(self, notice):
+        """TTL 안의 디스크 캐시 (없거나 만료·손상되었거나 링크가 바뀌었으면 None)"""
+        try:
+            with open(self._path(notice["id"]), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not self._fresh(entry, notice):
+            return None
+        with self._lock:
+            self.stats["disk_hits"] += 1
+        return entry
+
+    def _fetch_and_store(self, notice):
+        body = self._fetch(notice)
+        entry = {
+            "id": notice["id"],
+            "link": notice.get("link"),
+            "text": body["text"],
+            "attachments": body["attachments"],
+            "fetched_at": time.time()
+        }
+        with self._lock:
+            self.stats["fetches"] += 1
+
+        # 임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(notice["id"])
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] 본문 캐시 저장 실패 ({notice['id']}): {e}")
+        return entry
+
+    def _remember(self, notice_id, entry):
+        """메모리 LRU에 넣고 한도를 넘으면 오래 안 쓴 본문부터 제거"""
+        size = _entry_size(entry)
+        with self._lock:
+            _, old_size = self._lru.pop(notice_id, (None, 0))
+            self._lru[notice_id] = (entry, size)
+            self._bytes += size - old_size
+            while self._bytes > self.max_bytes and len(self._lru) > 1:
+                _, (_, evicted_size) = self._lru.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def status(self):
+        with self._lock:
+            return {"entries": len(self._lru), "bytes": self._bytes, **self.stats}
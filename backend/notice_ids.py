@@ -0,0 +1,43 @@
+"""공지사항 고유 ID
+
+게시판 자체 글 번호(호서대 fn_viewData/schIdx, 도서관 articleId, 캔두 프로그램 ID)로
+ID를 만들고, 글 번호가 없으면 제목+링크 해시를 쓴다. 병합 순서와 무관하게 항상 같은 값이 나온다.
+"""
+import hashlib
+import re
+
+ARTICLE_ID_PATTERNS = [
+    re.compile(r"schIdx=(\d+)"),          # 호서대 BBSView.mbz
+    re.compile(r"/bbs/notice/(\d+)"),     # 도서관
+    re.compile(r"pgdx=([\w-]+)"),         # 캔두 programView.aspx
+]
+CONTENT_HASH_PATTERN = re.compile(r"h[0-9a-f]{16}")
+
+
+def article_id_from_link(link):
+    """링크에서 게시판 글 번호 추출 (없으면 None)"""
+    for pattern in ARTICLE_ID_PATTERNS:
+        match = pattern.search(link or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def content_hash_id(title, link):
+    """글 번호가 없을 때 쓰는 제목+링크 해시"""
+    raw = f"{title or ''}\n{link or ''}".encode("utf-8")
+    return "h" + hashlib.sha1(raw).hexdigest()[:16]
+
+
+def is_content_hash_id(article_id):
+    """글 번호 대신 제목+링크 해시로 만든 ID인지"""
+    return bool(CONTENT_HASH_PATTERN.fullmatch(article_id or ""))
+
+
+def derive_article_id(title, link, article_id=None):
+    """스크래퍼가 준 글 번호 → 링크의 글 번호 → 해시 순으로 결정"""
+    return article_id or article_id_from_link(link) or content_hash_id(title, link)
+
+
+def make_notice_id(source, article_id):
+    return f"{source}-{article_id}"
@@ -0,0 +1,247 @@
+"""공지사항 조회용 인덱스
+
+병합 시점에 소스별 목록, 태그 → 공지 목록, 날짜순 정렬을 갱신해 두고
+/api/notices 요청은 전체를 훑지 않고 필요한 만큼만 꺼낸다.
+app.cache와 같은 데이터를 가리키므로 호출하는 쪽에서 cache_lock으로 보호한다.
+"""
+import base64
+import bisect
+import heapq
+import json
+import re
+
+from search_index import SearchIndex, normalize_text
+
+
+DATE_PATTERN = re.compile(r"(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})")
+
+
+def normalize_date(date_str):
+    """YYYY.MM.DD, YYYY-MM-DD, YYYY/MM/DD → YYYY-MM-DD (날짜가 아니면 None)"""
+    match = DATE_PATTERN.search(date_str or "")
+    if not match:
+        return None
+    year, month, day = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def date_sort_key(date_str):
+    """정렬용 날짜 문자열 ('날짜 없음' 등은 가장 오래된 것으로 취급)"""
+    return normalize_date(date_str) or ""
+
+
+def feed_sort_key(notice):
+    """공지 정렬 키 (수집 시 정규화한 isoDate, 없으면 date에서 계산)"""
+    iso_date = notice.get("isoDate")
+    return iso_date if iso_date is not None else date_sort_key(notice.get("date"))
+
+
+def notice_sources(notice):
+    """공지가 속한 소스 목록 (여러 게시판에 올라온 호서대 공지는 categories)"""
+    return notice.get("categories") or [notice.get("source")]
+
+
+def encode_cursor(sort_key):
+    """정렬 키를 URL에 넣을 수 있는 커서 문자열로 변환"""
+    raw = json.dumps(list(sort_key), ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 정렬 키로 복원 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date, doc_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return (str(date), int(doc_id))
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+class NoticeIndex:
+    def __init__(self, max_removed=5000):
+        self.max_removed = max_removed
+        self._next_doc_id = 0
+        self._doc_ids = {}     # 공지 id -> doc_id
+        self._docs = {}        # doc_id -> notice
+        self._groups = {}      # doc_id -> update_source로 반영한 묶음 (소스 또는 "hoseo")
+        self._sort_keys = {}   # doc_id -> (날짜, doc_id)
+        self._doc_tags = {}    # doc_id -> 정규화된 태그 집합
+        self._order = []       # 전체 (날짜, doc_id) 오름차순
+        self._by_source = {}   # source -> (날짜, doc_id) 오름차순
+        self._by_tag = {}      # 정규화된 태그 -> (날짜, doc_id) 오름차순
+        self._seqs = {}        # doc_id -> 변경 순번
+        self._by_seq = []      # (변경 순번, doc_id) 오름차순
+        self._removed = []     # (삭제 순번, 공지 id) 오름차순, 최근 max_removed건
+        self.removed_floor = 0  # 보관 한도를 넘어 버린 삭제 기록의 마지막 순번
+        self._search = SearchIndex()  # 제목/태그 검색어 → doc_id
+
+    def __len__(self):
+        return len(self._docs)
+
+    def get(self, notice_id):
+        """공지 ID로 공지 하나 조회 (없으면 None)"""
+        doc_id = self._doc_ids.get(notice_id)
+        return dict(self._docs[doc_id]) if doc_id is not None else None
+
+    def update_source(self, source, notices, next_seq=None):
+        """병합이 끝난 소스(또는 통합된 호서대 게시판 묶음)의 공지 목록을 인덱스에 반영 (추가/삭제된 공지만 처리)
+
+        next_seq: 목록에서 빠진 공지에 삭제 순번을 부여하는 함수 (없으면 삭제를 기록하지 않음)
+        """
+        current = {notice["id"]: notice for notice in notices}
+
+        stale = [key for key, doc_id in self._doc_ids.items()
+                 if self._groups[doc_id] == source and key not in current]
+        for key in stale:
+            doc_id = self._doc_ids.pop(key)
+            self._groups.pop(doc_id)
+            self._remove(doc_id)
+            if next_seq is not None:
+                self.record_removal(key, next_seq())
+
+        for key, notice in current.items():
+            doc_id = self._doc_ids.get(key)
+            if doc_id is None:
+                doc_id = self._next_doc_id
+                self._next_doc_id += 1
+                self._doc_ids[key] = doc_id
+                self._groups[doc_id] = source
+                self._add(doc_id, notice)
+            elif (self._sort_keys[doc_id][0] != feed_sort_key(notice)
+                    or self._seqs[doc_id] != notice.get("seq", 0)
+                    or notice_sources(self._docs[doc_id]) != notice_sources(notice)):
+                self._remove(doc_id)
+                self._add(doc_id, notice)
+            else:
+                self._docs[doc_id] = notice
+
+    def _add(self, doc_id, notice):
+        sort_key = (feed_sort_key(notice), doc_id)
+        tags = {normalize_text(tag) for tag in notice.get("tags", [])}
+
+        self._docs[doc_id] = notice
+        self._sort_keys[doc_id] = sort_key
+        self._doc_tags[doc_id] = tags
+        self._seqs[doc_id] = notice.get("seq", 0)
+        bisect.insort(self._by_seq, (self._seqs[doc_id], doc_id))
+        bisect.insort(self._order, sort_key)
+        for source in notice_sources(notice):
+            bisect.insort(self._by_source.setdefault(source, []), sort_key)
+        for tag in tags:
+            bisect.insort(self._by_tag.setdefault(tag, []), sort_key)
+        self._search.add(doc_id, notice.get("title", ""), notice.get("tags", []))
+
+    def _remove(self, doc_id):
+        notice = self._docs.pop(doc_id)
+        sort_key = self._sort_keys.pop(doc_id)
+        tags = self._doc_tags.pop(doc_id)
+
+        _discard_sorted(self._by_seq, (self._seqs.pop(doc_id), doc_id))
+        _discard_sorted(self._order, sort_key)
+        for source in notice_sources(notice):
+            _discard_sorted(self._by_source.get(source, []), sort_key)
+        for tag in tags:
+            postings = self._by_tag.get(tag, [])
+            _discard_sorted(postings, sort_key)
+            if not postings:
+                self._by_tag.pop(tag, None)
+        self._search.remove(doc_id)
+
+    def query(self, source=None, tag=None, q=None, since=None, limit=20, cursor=None):
+        """조건에 맞는 공지를 최신순으로 limit건 반환. (공지 목록, 다음 커서) 반환
+
+        source/tag/검색 결과 중 가장 짧은 정렬 목록을 뒤에서부터 훑고, 나머지 조건은 건별로 확인한다.
+        since(YYYY-MM-DD)보다 오래된 공지에 도달하면 탐색을 멈춘다. 날짜가 아닌 since는 ValueError.
+        """
+        since_key = None
+        if since:
+            since_key = normalize_date(since)
+            if since_key is None:
+                raise ValueError("since는 YYYY-MM-DD 형식의 날짜여야 합니다.")
+
+        candidates = [self._order]
+        if source:
+            candidates.append(self._by_source.get(source, []))
+        norm_tag = normalize_text(tag) if tag else None
+        if norm_tag:
+            candidates.append(self._by_tag.get(norm_tag, []))
+        matched = None
+        if q and normalize_text(q):
+            matched = self._search.search(q)
+            candidates.append(sorted(self._sort_keys[doc_id] for doc_id in matched))
+        walk = min(candidates, key=len)
+
+        position = len(walk)
+        if cursor:
+            position = bisect.bisect_left(walk, decode_cursor(cursor))
+
+        results = []
+        last_key = None
+        while position > 0:
+            position -= 1
+            sort_key = walk[position]
+            if since_key and sort_key[0] < since_key:
+                break
+
+            doc_id = sort_key[1]
+            notice = self._docs[doc_id]
+            if source and source not in notice_sources(notice):
+                continue
+            if norm_tag and norm_tag not in self._doc_tags[doc_id]:
+                continue
+            if matched is not None and doc_id not in matched:
+                continue
+
+            if len(results) == limit:
+                return results, encode_cursor(last_key)
+            results.append(dict(notice))
+            last_key = sort_key
+
+        return results, None
+
+    def record_removal(self, notice_id, seq):
+        """공지 삭제(아카이브 이동 등) 기록. 오래된 기록은 max_removed건만 남김"""
+        self._removed.append((seq, notice_id))
+        if len(self._removed) > self.max_removed:
+            overflow = len(self._removed) - self.max_removed
+            self.removed_floor = self._removed[overflow - 1][0]
+            del self._removed[:overflow]
+
+    def removals(self):
+        """삭제 기록 [[순번, 공지 id], ...] (저장·스냅샷 발행용)"""
+        return [list(entry) for entry in self._removed]
+
+    def load_removals(self, removals, floor=0):
+        """저장해 둔 삭제 기록으로 교체"""
+        self._removed = sorted((int(seq), str(notice_id)) for seq, notice_id in removals)
+        self.removed_floor = floor
+
+    def _removed_position(self, since):
+        return bisect.bisect_left(self._removed, (since + 1, ""))
+
+    def removed_since(self, since):
+        """삭제 순번이 since보다 큰 삭제 기록 [{"id", "seq"}]"""
+        return [{"id": notice_id, "seq": seq} for seq, notice_id in self._removed[self._removed_position(since):]]
+
+    def changes(self, since, limit=500):
+        """변경 순번이 since보다 큰 공지와 삭제 기록을 순번 오름차순으로 반환.
+        (공지 목록, 삭제 목록 [{"id", "seq"}], 마지막 순번, 남은 변경 여부)
+        """
+        position = bisect.bisect_right(self._by_seq, (since, float("inf")))
+        removed_position = self._removed_position(since)
+        updated = ((seq, False, doc_id) for seq, doc_id in self._by_seq[position:position + limit])
+        removed = ((seq, True, notice_id) for seq, notice_id in self._removed[removed_position:removed_position + limit])
+        entries = list(heapq.merge(updated, removed))[:limit]
+
+        notices = [dict(self._docs[key]) for _, is_removed, key in entries if not is_removed]
+        removed_ids = [{"id": key, "seq": seq} for seq, is_removed, key in entries if is_removed]
+        last_seq = entries[-1][0] if entries else since
+        remaining = len(self._by_seq) - position + len(self._removed) - removed_position
+        return notices, removed_ids, last_seq, remaining > limit
+
+
+def _discard_sorted(sorted_list, item):
+    """정렬된 리스트에서 item 제거 (없으면 무시)"""
+    i = bisect.bisect_left(sorted_list, item)
+    if i < len(sorted_list) and sorted_list[i] == item:
+        del sorted_list[i]
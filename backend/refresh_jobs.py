@@ -0,0 +1,116 @@
+"""강제 갱신 작업
+
+POST /api/refresh는 작업을 등록하고 바로 작업 ID를 돌려준다. 크롤링은 백그라운드 크롤러 스레드가
+스케줄러에서 즉시 예약된 소스를 꺼내 수행하므로 주기 크롤링과 겹쳐 돌지 않는다.
+이미 크롤링 중이거나 크롤링을 기다리는 소스는 다시 예약하지 않고 그 크롤링 결과를 함께 받으며,
+아직 시작하지 않은 같은 소스 구성의 작업이 있으면 그 작업을 그대로 돌려준다.
+연속으로 여러 번 요청해도 소스당 크롤링은 한 번이다.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+
+class RefreshJobs:
+    def __init__(self, schedule_now, max_finished=100):
+        """schedule_now(*sources): 소스들을 즉시 크롤링하도록 예약하는 함수"""
+        self._schedule_now = schedule_now
+        self.max_finished = max_finished
+        self._jobs = OrderedDict()  # 작업 ID -> 작업 (등록 순)
+        self._waiting = {}          # 소스 -> 이번(또는 다음) 크롤링 결과를 기다리는 작업 ID 집합
+        self._running = set()       # 크롤링 중인 소스
+        self._lock = threading.Lock()
+
+    def submit(self, source_keys):
+        """갱신 작업 등록. (작업, 기존 작업에 합쳐졌는지) 반환"""
+        sources = list(dict.fromkeys(source_keys))
+        to_schedule = []
+        with self._lock:
+            for job in self._jobs.values():
+                if job["state"] == "queued" and set(job["sources"]) == set(sources):
+                    return self._view(job), True
+
+            job = {
+                "id": uuid.uuid4().hex[:12],
+                "sources": sources,
+                "state": "queued",
+                "createdAt": datetime.now().isoformat(),
+                "startedAt": None,
+                "finishedAt": None,
+                "results": {}
+            }
+            for source in sources:
+                running = source in self._running
+                job["results"][source] = {"state": "running" if running else "queued"}
+                if running:
+                    job["state"] = "running"
+                    job["startedAt"] = job["createdAt"]
+                elif source not in self._waiting:
+                    to_schedule.append(source)
+                self._waiting.setdefault(source, set()).add(job["id"])
+            self._jobs[job["id"]] = job
+            view = self._view(job)
+
+        if to_schedule:
+            self._schedule_now(*to_schedule)
+        return view, False
+
+    def source_started(self, source):
+        """소스 크롤링 시작 (크롤러 스레드에서 호출)"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._running.add(source)
+            for job_id in self._waiting.get(source, ()):
+                job = self._jobs[job_id]
+                job["results"][source] = {"state": "running"}
+                if job["state"] == "queued":
+                    job["state"] = "running"
+                    job["startedAt"] = now
+
+    def source_finished(self, source, success, new_count=0, status_changed=0, error=None):
+        """소스 크롤링 결과를 기다리던 작업에 반영 (크롤러 스레드에서 호출)"""
+        now = datetime.now().isoformat()
+        outcome = {
+            "state": "success" if success else "failure",
+            "newCount": new_count,
+            "statusChangedCount": status_changed,
+            "finishedAt": now
+        }
+        if error:
+            outcome["error"] = error
+        with self._lock:
+            self._running.discard(source)
+            for job_id in self._waiting.pop(source, ()):
+                job = self._jobs[job_id]
+                job["results"][source] = dict(outcome)
+                if all(r["state"] in ("success", "failure") for r in job["results"].values()):
+                    job["state"] = "done"
+                    job["finishedAt"] = now
+            self._evict()
+
+    def _evict(self):
+        """끝난 작업은 최근 max_finished개만 보관"""
+        finished = [job_id for job_id, job in self._jobs.items() if job["state"] == "done"]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def _view(self, job):
+        done = sum(1 for r in job["results"].values() if r["state"] in ("success", "failure"))
+        return {
+            **job,
+            "sources": list(job["sources"]),
+            "results": {source: dict(r) for source, r in job["results"].items()},
+            "progress": {"done": done, "total": len(job["sources"])}
+        }
+
+    def get(self, job_id):
+        """작업 상태 (없거나 오래되어 지워졌으면 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._view(job) if job is not None else None
+
+    def status(self):
+        with self._lock:
+            states = [job["state"] for job in self._jobs.values()]
+            return {state: states.count(state) for state in ("queued", "running", "done")}
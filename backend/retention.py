@@ -0,0 +1,51 @@
+"""hot set 보존 기준
+
+소스별로 최근 공지만 메모리 캐시(/api/all, /api/notices)에 남기고, 기준을 벗어난 공지는
+아카이브로 옮긴다. 기준은 게시일 기준 최대 보존 기간과 최대 건수이며,
+'마감'된 캔두 프로그램은 신청 기간이 끝나고 유예 기간이 지나면 바로 내린다.
+"""
+from datetime import date, timedelta
+
+from notice_index import date_sort_key
+
+
+def _to_date(date_str):
+    """YYYY.MM.DD / YYYY-MM-DD 문자열을 date로 (형식이 다르면 None)"""
+    try:
+        return date.fromisoformat(date_sort_key(date_str)[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+def is_closed_expired(notice, today, grace_days):
+    """마감된 캔두 프로그램의 기간이 끝나고 유예 기간이 지났는지"""
+    if notice.get("status") != "마감":
+        return False
+    end = _to_date(notice.get("endDate")) or _to_date(notice.get("date"))
+    return end is not None and end + timedelta(days=grace_days) < today
+
+
+def split_retained(notices, max_age_days=None, max_count=None, closed_grace_days=None, today=None):
+    """(hot set에 남길 공지, 아카이브로 옮길 공지) 반환
+
+    게시일을 알 수 없는 공지는 기간 기준으로는 남기고, 건수 기준에서는 가장 오래된 것으로 본다.
+    """
+    today = today or date.today()
+    cutoff = today - timedelta(days=max_age_days) if max_age_days else None
+
+    kept, expired = [], []
+    for notice in notices:
+        posted = _to_date(notice.get("date"))
+        if cutoff and posted is not None and posted < cutoff:
+            expired.append(notice)
+        elif closed_grace_days is not None and is_closed_expired(notice, today, closed_grace_days):
+            expired.append(notice)
+        else:
+            kept.append(notice)
+
+    if max_count and len(kept) > max_count:
+        kept.sort(key=lambda n: date_sort_key(n.get("date")) if _to_date(n.get("date")) else "", reverse=True)
+        expired.extend(kept[max_count:])
+        kept = kept[:max_count]
+
+    return kept, expired
@@ -0,0 +1,121 @@
+"""소스별 적응형 크롤링 스케줄러
+
+소스마다 다음 크롤링 시각을 우선순위 큐(heap)로 관리한다.
+새 공지가 나온 소스는 주기를 줄이고, 계속 변화가 없는 소스는 주기를 늘린다.
+시작 시에는 비어 있는 소스, 오래된 소스 순으로 먼저 크롤링한다.
+"""
+import heapq
+import threading
+import time
+from datetime import datetime
+
+
+class CrawlScheduler:
+    def __init__(self, source_keys, base_interval, min_interval, max_interval, retry_interval,
+                 speedup=0.5, slowdown=1.5):
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.retry_interval = retry_interval
+        self.speedup = speedup
+        self.slowdown = slowdown
+        self.intervals = {source: base_interval for source in source_keys}
+        self.next_due = {}
+        self._order = {source: i for i, source in enumerate(source_keys)}  # 같은 시각이면 정의 순서대로
+        self._heap = []  # (예정 시각, 정의 순서, 소스)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def seed(self, last_updated, counts, now=None):
+        """시작 시 큐 구성: 빈 소스 → 오래된 소스 → 최근 갱신된 소스 순"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._heap = []
+            for source, interval in self.intervals.items():
+                updated_at = _parse_timestamp(last_updated.get(source))
+                if not counts.get(source) or updated_at is None:
+                    due = 0  # 비어 있거나 갱신 기록이 없으면 가장 먼저
+                else:
+                    due = updated_at + interval
+                self._push(source, due)
+        self._wake.set()
+
+    def _push(self, source, due):
+        self.next_due[source] = due
+        heapq.heappush(self._heap, (due, self._order[source], source))
+
+    def pop_due(self, now=None):
+        """예정 시각이 지난 소스를 우선순위 순서대로 꺼냄"""
+        now = now if now is not None else time.time()
+        due_sources = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due, _, source = heapq.heappop(self._heap)
+                if self.next_due.get(source) != due:
+                    continue  # 다시 예약되어 무효가 된 항목
+                del self.next_due[source]
+                due_sources.append(source)
+        return due_sources
+
+    def seconds_until_next(self, now=None):
+        """다음 예정 소스까지 남은 시간 (큐가 비어 있으면 None)"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - now)
+
+    def record(self, source, success, change_count, now=None):
+        """크롤링 결과로 주기를 조정하고 다음 예정 시각을 등록"""
+        now = now if now is not None else time.time()
+        with self._lock:
+            interval = self.intervals[source]
+            if not success:
+                due = now + min(self.retry_interval, interval)
+            else:
+                if change_count > 0:
+                    interval = max(self.min_interval, interval * self.speedup)
+                else:
+                    interval = min(self.max_interval, interval * self.slowdown)
+                self.intervals[source] = interval
+                due = now + interval
+            self._push(source, due)
+        self._wake.set()
+
+    def schedule_now(self, *sources):
+        """지정한 소스들을 즉시 크롤링하도록 예약 (한 번에 꺼내지도록 함께 등록)"""
+        with self._lock:
+            for source in sources:
+                self._push(source, 0)
+        self._wake.set()
+
+    def wait(self, timeout):
+        """다음 예정 시각까지 대기 (새 예약이 들어오면 즉시 깨어남)"""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    def wake(self):
+        self._wake.set()
+
+    def status(self):
+        """소스별 현재 주기와 다음 예정 시각"""
+        now = time.time()
+        with self._lock:
+            return {
+                source: {
+                    "interval_seconds": round(self.intervals[source]),
+                    "next_run": (datetime.fromtimestamp(max(self.next_due[source], now)).isoformat()
+                                 if source in self.next_due else None)
+                }
+                for source in self.intervals
+            }
+
+
+def _parse_timestamp(value):
+    """ISO 형식 문자열을 epoch 초로 변환 (실패 시 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
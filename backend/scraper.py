@@ -1,10 +1,129 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+import requests
 import re
 import os
+import time
+from datetime import datetime
+from urllib.parse import urljoin
+
+from metrics import CRAWL_STAGE_SECONDS
+from notice_ids import is_content_hash_id
+
+# Selenium은 브라우저를 처음 띄울 때 불러온다 (HTTP 크롤링·본문 가져오기만 하는 프로세스는 불러오지 않음)
+webdriver = By = Options = WebDriverWait = EC = None
+
+
+def _load_selenium():
+    """Selenium 모듈을 불러와 전역에 설정. 설치되어 있지 않으면 False"""
+    global webdriver, By, Options, WebDriverWait, EC
+    if webdriver is not None:
+        return True
+    try:
+        from selenium import webdriver as _webdriver
+        from selenium.webdriver.common.by import By as _By
+        from selenium.webdriver.chrome.options import Options as _Options
+        from selenium.webdriver.support.ui import WebDriverWait as _WebDriverWait
+        from selenium.webdriver.support import expected_conditions as _EC
+    except ImportError:  # Selenium이 없으면 HTTP 크롤링과 본문 가져오기만 가능
+        return False
+    By, Options, WebDriverWait, EC = _By, _Options, _WebDriverWait, _EC
+    webdriver = _webdriver
+    return True
+
+HOSEO_BASE_URL = "https://www.hoseo.ac.kr"
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+HTTP_TIMEOUT = 30
+
+# ===== 캔두 =====
+CANDO_BASE_URL = "https://cando.hoseo.ac.kr"
+CANDO_LIST_URL = CANDO_BASE_URL + "/Career/CareerTask/ProgramList.aspx"
+CANDO_VIEW_URL = CANDO_BASE_URL + "/community/Program/programView.aspx?pgdx={}"  # 목록의 goView(pgdx)가 여는 상세 페이지
+
+# ===== 도서관 JSON API =====
+# 도서관 Angular SPA가 noticeArticles를 받아오는 백엔드 API (SPA 배포가 바뀌면 여기만 수정)
+LIBRARY_BASE_URL = "https://library.hoseo.ac.kr"
+LIBRARY_API_URL = LIBRARY_BASE_URL + "/pyxis-api/1/bulletin-boards/1/bulletins"
+LIBRARY_API_PAGE_SIZE = 50
+LIBRARY_MAX_ARTICLES = 200  # 브라우저 모드의 max=200과 동일
+LIBRARY_NOTICE_URL = LIBRARY_BASE_URL + "/#/bbs/notice/{}"  # API·브라우저 모드 공통 공지 링크
+LIBRARY_NOTICE_ID_PATTERN = re.compile(r"/bbs/notice/(\d+)")
+
+# ===== 경량 브라우저 모드 =====
+# 목록 추출에 필요 없는 이미지·스타일시트·폰트와 아래에 적은 분석·광고 도메인 요청은 CDP로 차단
+# (Network.setBlockedURLs는 패턴 목록만 받으므로 그 밖의 외부 호스트는 막지 않는다)
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*facebook.com/tr*", "*wcs.naver.net*", "*kakao.com*",
+    "*youtube.com*", "*ytimg.com*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+]
+STABLE_POLL_SECONDS = 0.25  # 목록 개수 안정화 확인 간격
+STABLE_SETTLE_SECONDS = 0.5  # 목록 개수가 이 시간 동안 그대로면 렌더링 완료로 판단
+
+# ===== 페이지 내 추출 스크립트 (페이지당 WebDriver 왕복 1회) =====
+LIBRARY_EXTRACT_JS = """
+return Array.prototype.map.call(document.querySelectorAll('.ikc-item'), function (row) {
+    var link = row.querySelector('.ikc-item-title');
+    var date = null;
+    var spans = row.querySelectorAll('span');
+    for (var i = 0; i < spans.length; i++) {
+        var text = spans[i].innerText.trim();
+        if (/^\\d{4}\\.\\d{2}\\.\\d{2}/.test(text)) {
+            date = text;
+            break;
+        }
+    }
+    return {
+        title: link ? link.innerText.trim() : null,
+        href: link ? link.href : null,
+        date: date
+    };
+});
+"""
+
+BBS_LIST_EXTRACT_JS = """
+var rows = [];
+document.querySelectorAll('table.ui-list tbody tr').forEach(function (row) {
+    var link = row.querySelector('td.board-list-title a');
+    var date = row.querySelector("td[data-header='등록일자']");
+    if (!link || !date) {
+        return;
+    }
+    rows.push({
+        title: link.innerText.trim(),
+        href: link.getAttribute('href') || '',
+        date: date.innerText.trim()
+    });
+});
+return rows;
+"""
+
+CANDO_EXTRACT_JS = """
+return Array.prototype.map.call(document.querySelectorAll('.prod-list'), function (card) {
+    function text(selector) {
+        var el = card.querySelector(selector);
+        return el ? el.innerText.trim() : null;
+    }
+    var link = card.querySelector('a');
+    var item = card.closest('[onclick]');
+    return {
+        onclick: item ? item.getAttribute('onclick') : null,
+        title: text(".prod1.text-info, [id$='_Title_txt']"),
+        href: link ? link.getAttribute('href') : null,
+        absoluteHref: link ? link.href : null,
+        dateText: text("[id$='_DateTime_txt'], .prod2"),
+        statusText: text("[name='finishDate'], [id$='_finishDate'], .label.label-white span"),
+        labels: Array.prototype.map.call(card.querySelectorAll('.label'), function (el) {
+            return el.innerText.trim();
+        })
+    };
+});
+"""
 
 # 캔두 쿠키 로드
 def load_cando_cookies():
@@ -33,10 +152,204 @@ def load_cando_cookies():
     
     return cookies
 
+def format_library_date(value):
+    """도서관 API의 dateCreated를 목록 표기(YYYY.MM.DD)로 변환"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000).strftime("%Y.%m.%d")  # epoch 밀리초
+    match = re.match(r"(\d{4})[-./](\d{1,2})[-./](\d{1,2})", str(value or "").strip())
+    if not match:
+        return "날짜 없음"
+    year, month, day = match.groups()
+    return f"{year}.{int(month):02d}.{int(day):02d}"
+
+def parse_library_articles(payload):
+    """도서관 API 응답에서 게시글 목록과 전체 건수 추출. (articles, total_count 또는 None) 반환"""
+    data = payload.get("data", payload) if isinstance(payload, dict) else payload
+    if isinstance(data, list):
+        return data, None
+    if not isinstance(data, dict):
+        raise ValueError("도서관 API 응답 형식 오류")
+    for key in ("list", "noticeArticles", "articles", "bulletins"):
+        if isinstance(data.get(key), list):
+            return data[key], data.get("totalCount")
+    raise ValueError("도서관 API 응답에 게시글 목록 없음")
+
+def create_http_session(pool_size=10):
+    """keep-alive 커넥션 풀을 사용하는 HTTP 세션 생성"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return session
+
+def _clean_text(text):
+    """연속 공백을 하나로 정리 (Selenium .text와 동일한 형태, None이면 빈 문자열)"""
+    return " ".join((text or "").split())
+
+def parse_bbs_list(html, base_url=HOSEO_BASE_URL):
+    """BBSList.mbz HTML에서 제목/링크/날짜 추출"""
+    view_url = f"{base_url}/Home//BBSView.mbz?action=MAPP_1708240139&schIdx="
+    elements = {
+        "제목": [],
+        "링크": [],
+        "날짜": []
+    }
+    
+    soup = BeautifulSoup(html, "html.parser")
+    for row in soup.select("table.ui-list tbody tr"):
+        title_link = row.select_one("td.board-list-title a")
+        date_td = row.select_one("td[data-header='등록일자']")
+        if title_link is None or date_td is None:
+            continue
+        
+        match = re.search(r"fn_viewData\('(\d+)'\)", title_link.get("href", ""))
+        link = view_url + match.group(1) if match else "링크 없음"
+        
+        elements["제목"].append(_clean_text(title_link.get_text()))
+        elements["링크"].append(link)
+        elements["날짜"].append(_clean_text(date_td.get_text()))
+    
+    return elements
+
+# 본문 영역 후보 (호서대 BBSView, 캔두 programView 순). 없으면 텍스트가 가장 긴 블록을 본문으로 사용
+BODY_SELECTORS = [
+    ".board-view-content", ".board-view .view-content", ".view-con", ".bbs-view-content",
+    "td.board-view-contents", ".ui-view .content", ".prod-view", ".program-view", "#contents .view",
+]
+ATTACHMENT_PATTERN = re.compile(r"download|filedown|atchfile|attach", re.I)
+
+def parse_notice_body(html, base_url):
+    """공지 상세 페이지에서 본문 텍스트와 첨부파일 목록 추출"""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    
+    attachments = []
+    seen = set()
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        if not ATTACHMENT_PATTERN.search(href) and not ATTACHMENT_PATTERN.search(link.get("onclick", "")):
+            continue
+        url = urljoin(base_url, href) if not href.startswith("javascript") else None
+        name = _clean_text(link.get_text()) or (url or "").rsplit("/", 1)[-1]
+        if name and (name, url) not in seen:
+            seen.add((name, url))
+            attachments.append({"name": name, "url": url})
+    
+    body = None
+    for selector in BODY_SELECTORS:
+        body = soup.select_one(selector)
+        if body is not None:
+            break
+    if body is None:
+        # 후보가 없으면 직접 포함한 텍스트가 가장 긴 블록
+        blocks = soup.find_all(["div", "td", "article", "section"])
+        body = max(blocks, key=lambda el: sum(len(t.strip()) for t in el.find_all(string=True, recursive=False)),
+                   default=soup)
+    
+    lines = [_clean_text(line) for line in body.get_text("\n").splitlines()]
+    return {
+        "text": "\n".join(line for line in lines if line),
+        "attachments": attachments
+    }
+
+def parse_library_article(payload):
+    """도서관 API 게시글 상세 응답에서 본문과 첨부파일 추출"""
+    article = payload.get("data", payload) if isinstance(payload, dict) else {}
+    content = article.get("content") or ""
+    text = parse_notice_body(f"<div class='view-con'>{content}</div>", LIBRARY_BASE_URL)["text"]
+    attachments = []
+    for attachment in article.get("attachments") or []:
+        name = attachment.get("originalFileName") or attachment.get("fileName") or attachment.get("name")
+        url = attachment.get("url") or attachment.get("downloadUrl")
+        if name:
+            attachments.append({"name": name, "url": urljoin(LIBRARY_BASE_URL, url) if url else None})
+    return {"text": text, "attachments": attachments}
+
+def parse_cando_card(card):
+    """캔두 카드 추출 결과(dict)를 (제목, 링크, 날짜, 상태, 프로그램 ID, 종료일)로 변환"""
+    title = (card.get("title") or "").strip()
+    
+    # 프로그램 ID: 카드를 감싼 li의 onclick="javascript:goView('...')"
+    program_id = None
+    id_match = re.search(r"goView\('([^']+)'\)", card.get("onclick") or "")
+    if id_match:
+        program_id = id_match.group(1)
+    
+    # 링크: 프로그램 상세 페이지 (goView가 여는 주소), ID가 없으면 카드 내 a 태그, 그것도 없으면 목록
+    link = CANDO_LIST_URL
+    if program_id:
+        link = CANDO_VIEW_URL.format(program_id)
+    elif card.get("href") and card["href"] != "#":
+        link = card.get("absoluteHref") or card["href"]
+    
+    # 날짜: "신청2025-12-01~2025-12-31" 형태에서 시작일, 마지막 날짜는 종료일
+    date = "날짜 없음"
+    end_date = None
+    dates = re.findall(r'\d{4}-\d{2}-\d{2}', card.get("dateText") or "")
+    if dates:
+        date = dates[0]
+        end_date = dates[-1]
+    
+    # 상태: finishDate 또는 label-white에서 추출, 없으면 .label 목록에서 탐색
+    status = "진행중"
+    status_text = card.get("statusText")
+    if status_text is not None:
+        if "마감" in status_text:
+            status = "마감"
+        elif status_text:
+            status = status_text
+    else:
+        for label_text in card.get("labels") or []:
+            if "마감" in label_text:
+                status = "마감"
+                break
+            elif "진행" in label_text:
+                status = "진행중"
+                break
+    
+    return title, link, date, status, program_id, end_date
+
+class element_count_stable:
+    """selector에 맞는 요소 수가 1개 이상이고 settle초 동안 바뀌지 않으면 그 수를 반환하는 대기 조건"""
+    def __init__(self, selector, settle=STABLE_SETTLE_SECONDS):
+        self.selector = selector
+        self.settle = settle
+        self._count = None
+        self._since = None
+
+    def __call__(self, driver):
+        count = driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", self.selector)
+        now = time.monotonic()
+        if count != self._count:
+            self._count, self._since = count, now
+            return False
+        if count and now - self._since >= self.settle:
+            return count
+        return False
+
+def is_known_page(elements, start, known_keys):
+    """start 이후에 추가된 행이 모두 이미 수집된 공지인지 확인 (증분 크롤링 중단 조건)"""
+    if not known_keys:
+        return False
+    keys = list(zip(elements["제목"][start:], elements["링크"][start:]))
+    return bool(keys) and all(key in known_keys for key in keys)
+
 class NoticeScraper:
-    def __init__(self):
+    def __init__(self, fetch_mode="http", lean=True):
+        """fetch_mode: 'http' (BBSList를 HTTP로 직접 파싱) 또는 'browser' (Selenium)
+        lean: 이미지·CSS·폰트·알려진 분석·광고 도메인을 차단하고 DOMContentLoaded까지만 기다리는 경량 브라우저
+        
+        드라이버는 브라우저가 필요한 소스를 처음 크롤링할 때 생성된다.
+        """
         self.driver = None
-        self._setup_driver()
+        self.session = None
+        self.fetch_mode = fetch_mode
+        self.lean = lean
+        self.source_label = "unknown"  # 메트릭 라벨 (크롤링 중인 소스, 호출하는 쪽에서 설정)
+        self.page_loads = 0  # 현재 드라이버로 연 페이지 수 (드라이버 풀의 교체 기준)
 
     def _setup_driver(self):
         """드라이버 초기화"""
@@ -46,6 +359,9 @@ class NoticeScraper:
             except:
                 pass
         
+        if not _load_selenium():
+            raise RuntimeError("브라우저 크롤링에는 selenium 패키지가 필요합니다.")
+        
         options = Options()
         options.add_argument("--headless=new")
         options.add_argument("--disable-gpu")
@@ -60,13 +376,42 @@ class NoticeScraper:
         options.add_argument("--disable-software-rasterizer")
         options.add_argument("--remote-debugging-port=0")
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        options.page_load_strategy = 'normal'
-        self.driver = webdriver.Chrome(options=options)
+        if self.lean:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            })
+            options.page_load_strategy = 'eager'  # 하위 리소스를 기다리지 않고 DOMContentLoaded에서 반환
+        else:
+            options.page_load_strategy = 'normal'
+        with self._stage("driver_start"):
+            self.driver = webdriver.Chrome(options=options)
         self.driver.set_page_load_timeout(30)
         self.driver.implicitly_wait(5)
+        self.page_loads = 0
+        if self.lean:
+            self._block_resources()
+
+    def _block_resources(self):
+        """CDP로 불필요한 리소스 요청 차단 (실패해도 일반 모드로 계속)"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"[WARNING] 리소스 차단 설정 실패: {e}")
+
+    def _wait_for_stable(self, selector, timeout):
+        """selector 요소가 나타나고 개수가 더 이상 늘지 않을 때까지 대기. 요소 수 반환"""
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=STABLE_POLL_SECONDS)
+        with self._stage("element_wait"):
+            return wait.until(element_count_stable(selector))
     
     def _ensure_driver(self):
         """드라이버 세션이 유효한지 확인하고 필요시 재생성"""
+        if self.driver is None:
+            self._setup_driver()
+            return
         try:
             # 세션 유효성 검사
             _ = self.driver.current_url
@@ -74,40 +419,124 @@ class NoticeScraper:
             print("[INFO] 드라이버 세션 만료, 재생성 중...")
             self._setup_driver()
 
-    def library(self):
-        """도서관 공지사항 크롤링"""
-        self._ensure_driver()
-        self.driver.get("https://library.hoseo.ac.kr/#/bbs/notice?offset=0&max=200")
-        wait = WebDriverWait(self.driver, 10)
-        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "ikc-item")))
+    def is_driver_alive(self):
+        """드라이버가 떠 있고 세션이 응답하는지 확인"""
+        if self.driver is None:
+            return False
+        try:
+            _ = self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _stage(self, stage):
+        """크롤링 단계 소요 시간 측정 (with 블록)"""
+        return CRAWL_STAGE_SECONDS.time(source=self.source_label, stage=stage)
+
+    def _get(self, url):
+        """드라이버로 페이지 이동 (페이지 수 집계)"""
+        self.page_loads += 1
+        with self._stage("navigation"):
+            self.driver.get(url)
+
+    def _ensure_session(self):
+        """HTTP 세션이 없으면 생성"""
+        if self.session is None:
+            self.session = create_http_session()
+        return self.session
+
+    def _fetch_html(self, url):
+        """HTTP GET으로 페이지 HTML 가져오기"""
+        with self._stage("navigation"):
+            response = self._ensure_session().get(url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            return response.content
+
+    def _extract(self, script):
+        """페이지 내 스크립트 한 번으로 모든 행의 필드를 추출"""
+        with self._stage("extraction"):
+            return self.driver.execute_script(script) or []
+
+    def library(self, mode="api"):
+        """도서관 공지사항 크롤링
         
-        title_elements = self.driver.find_elements(By.CLASS_NAME, "ikc-item-title")
-        titles = [elem.text for elem in title_elements]
-        links = [elem.get_attribute("href") for elem in title_elements]
+        mode: 'api' (SPA가 쓰는 JSON API를 직접 호출) 또는 'browser' (Selenium으로 렌더링)
+        """
+        if mode == "api":
+            return self._library_api()
+        return self._library_browser()
+
+    def _library_api(self, max_articles=LIBRARY_MAX_ARTICLES):
+        """도서관 JSON API를 페이지 단위로 호출"""
+        session = self._ensure_session()
+        titles, links, dates, article_ids = [], [], [], []
+        offset = 0
+        while offset < max_articles:
+            page_size = min(LIBRARY_API_PAGE_SIZE, max_articles - offset)
+            with self._stage("navigation"):
+                response = session.get(LIBRARY_API_URL, params={"offset": offset, "max": page_size},
+                                       headers={"Accept": "application/json"}, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+            with self._stage("extraction"):
+                articles, total_count = parse_library_articles(response.json())
+            
+            for article in articles:
+                title = _clean_text(article.get("title"))
+                if not title or article.get("id") is None:
+                    continue
+                article_id = str(article["id"])
+                titles.append(title)
+                links.append(LIBRARY_NOTICE_URL.format(article_id))
+                dates.append(format_library_date(article.get("dateCreated")))
+                article_ids.append(article_id)
+            
+            offset += len(articles)
+            if len(articles) < page_size or (total_count is not None and offset >= total_count):
+                break
         
-        rows = self.driver.find_elements(By.CLASS_NAME, "ikc-item")
-        dates = []
-        for row in rows:
-            try:
-                date_spans = row.find_elements(By.TAG_NAME, "span")
-                for span in date_spans:
-                    text = span.text
-                    if re.match(r'\d{4}\.\d{2}\.\d{2}', text):
-                        dates.append(text)
-                        break
-                else:
-                    dates.append("날짜 없음")
-            except:
-                dates.append("날짜 없음")
+        return {
+            "제목": titles,
+            "링크": links,
+            "날짜": dates,
+            "글번호": article_ids
+        }
+
+    def _library_browser(self):
+        """도서관 SPA를 브라우저로 렌더링해서 크롤링"""
+        self._ensure_driver()
+        self._get("https://library.hoseo.ac.kr/#/bbs/notice?offset=0&max=200")
+        # Angular가 목록을 다 그릴 때까지 대기
+        self._wait_for_stable(".ikc-item", 10)
+        
+        titles, links, dates, article_ids = [], [], [], []
+        for row in self._extract(LIBRARY_EXTRACT_JS):
+            title = _clean_text(row["title"])
+            if not title:
+                continue
+            # 링크는 API 모드와 같은 형태로 (href의 ?offset=0&max=20 등은 제거)
+            id_match = LIBRARY_NOTICE_ID_PATTERN.search(row["href"] or "")
+            article_id = id_match.group(1) if id_match else None
+            titles.append(title)
+            links.append(LIBRARY_NOTICE_URL.format(article_id) if article_id else row["href"])
+            dates.append(row["date"] or "날짜 없음")
+            article_ids.append(article_id)
         
         return {
             "제목": titles,
             "링크": links,
-            "날짜": dates
+            "날짜": dates,
+            "글번호": article_ids
         }
 
-    def main_category(self, category_code, page_start=1, page_end=5):
-        """호서대 홈페이지 카테고리별 공지사항 크롤링"""
+    def main_category(self, category_code, page_start=1, page_end=5, known_keys=None):
+        """호서대 홈페이지 카테고리별 공지사항 크롤링
+        
+        known_keys: 이미 수집된 (제목, 링크) 집합. 주어지면 한 페이지가 전부 기존 공지일 때
+        이후 페이지는 요청하지 않는다 (게시판은 최신순 정렬).
+        """
+        if self.fetch_mode == "http":
+            return self._main_category_http(category_code, page_start, page_end, known_keys)
+        
         self._ensure_driver()
         all_elements = {
             "제목": [],
@@ -121,88 +550,114 @@ class NoticeScraper:
             try:
                 # 매 페이지마다 드라이버 세션 확인
                 self._ensure_driver()
+                row_start = len(all_elements["제목"])
                 
                 url = f"https://www.hoseo.ac.kr/Home//BBSList.mbz?action=MAPP_1708240139&schIdx=0&schCategorycode={category_code}&schKeytype=subject&schKeyword=&pageIndex={page}"
-                self.driver.get(url)
+                self._get(url)
                 wait = WebDriverWait(self.driver, 10)
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.ui-list tbody tr")))
+                with self._stage("element_wait"):
+                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.ui-list tbody tr")))
                 
-                rows = self.driver.find_elements(By.CSS_SELECTOR, "table.ui-list tbody tr")
+                for row in self._extract(BBS_LIST_EXTRACT_JS):
+                    match = re.search(r"fn_viewData\('(\d+)'\)", row["href"])
+                    if match:
+                        article_id = match.group(1)
+                        link = base_url + article_id
+                    else:
+                        link = "링크 없음"
+                    
+                    all_elements["제목"].append(row["title"])
+                    all_elements["링크"].append(link)
+                    all_elements["날짜"].append(row["date"])
                 
-                for row in rows:
-                    try:
-                        title_td = row.find_element(By.CSS_SELECTOR, "td.board-list-title")
-                        title_link = title_td.find_element(By.TAG_NAME, "a")
-                        title = title_link.text.strip()
-                        
-                        onclick_attr = title_link.get_attribute("href")
-                        match = re.search(r"fn_viewData\('(\d+)'\)", onclick_attr)
-                        if match:
-                            article_id = match.group(1)
-                            link = base_url + article_id
-                        else:
-                            link = "링크 없음"
-                        
-                        date_td = row.find_element(By.CSS_SELECTOR, "td[data-header='등록일자']")
-                        date = date_td.text.strip()
-                        
-                        all_elements["제목"].append(title)
-                        all_elements["링크"].append(link)
-                        all_elements["날짜"].append(date)
-                    except Exception as e:
-                        continue
+                if is_known_page(all_elements, row_start, known_keys):
+                    print(f"[INFO] 페이지 {page}: 새 공지 없음, 이후 페이지 생략")
+                    break
+            except Exception as e:
+                print(f"[ERROR] 페이지 {page} 크롤링 실패: {e}")
+                continue
+        
+        return all_elements
+
+    def _main_category_http(self, category_code, page_start, page_end, known_keys=None):
+        """BBSList는 서버에서 렌더링되므로 브라우저 없이 HTTP + HTML 파서로 크롤링"""
+        all_elements = {
+            "제목": [],
+            "링크": [],
+            "날짜": []
+        }
+        
+        for page in range(page_start, page_end + 1):
+            try:
+                url = f"{HOSEO_BASE_URL}/Home//BBSList.mbz?action=MAPP_1708240139&schIdx=0&schCategorycode={category_code}&schKeytype=subject&schKeyword=&pageIndex={page}"
+                html = self._fetch_html(url)
+                with self._stage("extraction"):
+                    page_elements = parse_bbs_list(html)
+                row_start = len(all_elements["제목"])
+                for column in all_elements:
+                    all_elements[column].extend(page_elements[column])
+                
+                if is_known_page(all_elements, row_start, known_keys):
+                    print(f"[INFO] 페이지 {page}: 새 공지 없음, 이후 페이지 생략")
+                    break
             except Exception as e:
                 print(f"[ERROR] 페이지 {page} 크롤링 실패: {e}")
                 continue
         
         return all_elements
 
-    def main_pg(self, page_start=1, page_end=5):
+    def main_pg(self, page_start=1, page_end=5, known_keys=None):
         """호서대 홈페이지 공지사항 (전체) 크롤링"""
-        return self.main_category("CTG_17082400011", page_start, page_end)
+        return self.main_category("CTG_17082400011", page_start, page_end, known_keys)
     
-    def main_fusion(self, page_start=1, page_end=3):
+    def main_fusion(self, page_start=1, page_end=3, known_keys=None):
         """융합교육 공지사항 크롤링"""
-        return self.main_category("CTG_24050300117", page_start, page_end)
+        return self.main_category("CTG_24050300117", page_start, page_end, known_keys)
     
-    def main_academic(self, page_start=1, page_end=3):
+    def main_academic(self, page_start=1, page_end=3, known_keys=None):
         """학사 공지사항 크롤링"""
-        return self.main_category("CTG_17082400012", page_start, page_end)
+        return self.main_category("CTG_17082400012", page_start, page_end, known_keys)
     
-    def main_scholarship(self, page_start=1, page_end=3):
+    def main_scholarship(self, page_start=1, page_end=3, known_keys=None):
         """장학 공지사항 크롤링"""
-        return self.main_category("CTG_17082400013", page_start, page_end)
+        return self.main_category("CTG_17082400013", page_start, page_end, known_keys)
     
-    def main_volunteer(self, page_start=1, page_end=3):
+    def main_volunteer(self, page_start=1, page_end=3, known_keys=None):
         """사회봉사 공지사항 크롤링"""
-        return self.main_category("CTG_17082400014", page_start, page_end)
+        return self.main_category("CTG_17082400014", page_start, page_end, known_keys)
     
-    def main_external(self, page_start=1, page_end=3):
+    def main_external(self, page_start=1, page_end=3, known_keys=None):
         """외부 공지사항 크롤링"""
-        return self.main_category("CTG_20012200070", page_start, page_end)
+        return self.main_category("CTG_20012200070", page_start, page_end, known_keys)
     
-    def main_career(self, page_start=1, page_end=3):
+    def main_career(self, page_start=1, page_end=3, known_keys=None):
         """취업 공지사항 크롤링"""
-        return self.main_category("CTG_20120400086", page_start, page_end)
+        return self.main_category("CTG_20120400086", page_start, page_end, known_keys)
 
     def cando(self, page_start=1, page_end=2):
-        """캔두 비교과프로그램 공지사항 크롤링 (쿠키 인증 포함)"""
+        """캔두 비교과프로그램 공지사항 크롤링 (쿠키 인증 포함)
+        
+        이미 수집된 프로그램도 상태(마감)가 바뀔 수 있으므로 증분 크롤링 없이 모든 페이지를 확인한다.
+        """
         self._ensure_driver()
         all_elements = {
             "제목": [],
             "링크": [],
             "날짜": [],
-            "상태": []
+            "상태": [],
+            "글번호": [],
+            "종료일": []
         }
         
-        import time
         max_retries = 3
         
         for retry in range(max_retries):
             try:
                 # 먼저 도메인 접속 (쿠키 설정 전 필요)
-                self.driver.get("https://cando.hoseo.ac.kr")
-                time.sleep(1)
+                self._get(CANDO_BASE_URL)
+                with self._stage("element_wait"):
+                    WebDriverWait(self.driver, 10).until(
+                        lambda d: d.execute_script("return document.readyState") != "loading")
                 
                 # 쿠키 설정
                 cookies = load_cando_cookies()
@@ -228,79 +683,24 @@ class NoticeScraper:
         for page in range(page_start, page_end + 1):
             try:
                 # 쿠키 적용 후 프로그램 리스트 페이지 접속
-                self.driver.get(f"https://cando.hoseo.ac.kr/Career/CareerTask/ProgramList.aspx?rp={page}")
-                wait = WebDriverWait(self.driver, 15)
-            
-                # prod-list 요소 대기
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".prod-list")))
+                self._get(f"{CANDO_LIST_URL}?rp={page}")
                 
-                time.sleep(2)  # 추가 대기
+                # prod-list 카드 수가 안정될 때까지 대기 (고정 sleep 대신)
+                self._wait_for_stable(".prod-list", 15)
                 
                 # prod-list 카드 형태로 크롤링
-                program_cards = self.driver.find_elements(By.CSS_SELECTOR, ".prod-list")
+                program_cards = self._extract(CANDO_EXTRACT_JS)
                 print(f"[INFO] 캔두 페이지 {page}: {len(program_cards)}건 발견")
                 
                 for card in program_cards:
-                    try:
-                        # 제목: prod1 text-info 클래스
-                        title_elem = card.find_element(By.CSS_SELECTOR, ".prod1.text-info, [id$='_Title_txt']")
-                        title = title_elem.text.strip()
-                        
-                        # 링크: 카드 내 a 태그 또는 onclick
-                        link = "https://cando.hoseo.ac.kr/Career/CareerTask/ProgramList.aspx"
-                        try:
-                            link_elem = card.find_element(By.TAG_NAME, "a")
-                            href = link_elem.get_attribute("href")
-                            if href and href != "#":
-                                link = href
-                        except:
-                            pass
-                        
-                        # 날짜: DateTime_txt 클래스에서 신청 기간 추출
-                        date = "날짜 없음"
-                        try:
-                            date_elem = card.find_element(By.CSS_SELECTOR, "[id$='_DateTime_txt'], .prod2")
-                            date_text = date_elem.text.strip()
-                            # "신청2025-12-01~2025-12-31" 형태에서 날짜 추출
-                            date_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_text)
-                            if date_match:
-                                date = date_match.group(1)
-                        except:
-                            pass
-                        
-                        # 상태: 마감 또는 진행중
-                        status = "진행중"
-                        try:
-                            # finishDate 또는 label-white 클래스에서 상태 추출
-                            status_elem = card.find_element(By.CSS_SELECTOR, "[name='finishDate'], [id$='_finishDate'], .label.label-white span")
-                            status_text = status_elem.text.strip()
-                            if "마감" in status_text:
-                                status = "마감"
-                            elif status_text:
-                                status = status_text
-                        except:
-                            # 다른 방법으로 시도
-                            try:
-                                labels = card.find_elements(By.CSS_SELECTOR, ".label")
-                                for label in labels:
-                                    label_text = label.text.strip()
-                                    if "마감" in label_text:
-                                        status = "마감"
-                                        break
-                                    elif "진행" in label_text:
-                                        status = "진행중"
-                                        break
-                            except:
-                                pass
-                        
-                        if title and len(title) > 1:
-                            all_elements["제목"].append(title)
-                            all_elements["링크"].append(link)
-                            all_elements["날짜"].append(date)
-                            all_elements["상태"].append(status)
-                            
-                    except Exception as e:
-                        continue
+                    title, link, date, status, program_id, end_date = parse_cando_card(card)
+                    if title and len(title) > 1:
+                        all_elements["제목"].append(title)
+                        all_elements["링크"].append(link)
+                        all_elements["날짜"].append(date)
+                        all_elements["상태"].append(status)
+                        all_elements["글번호"].append(program_id)
+                        all_elements["종료일"].append(end_date)
                         
             except Exception as e:
                 print(f"[ERROR] 캔두 페이지 {page} 크롤링 실패: {e}")
@@ -308,8 +708,43 @@ class NoticeScraper:
         
         return all_elements
 
+    def notice_body(self, source, link, article_id=None):
+        """공지 상세 페이지의 본문과 첨부파일 ({"text", "attachments"})
+        
+        호서대 BBSView와 캔두 programView는 HTTP로 가져오고 (캔두는 저장된 쿠키 사용),
+        도서관은 목록과 같은 JSON API의 게시글 상세를 호출한다.
+        """
+        session = self._ensure_session()
+        if source == "library":
+            with self._stage("navigation"):
+                response = session.get(f"{LIBRARY_API_URL}/{article_id}",
+                                       headers={"Accept": "application/json"}, timeout=HTTP_TIMEOUT)
+                response.raise_for_status()
+            with self._stage("extraction"):
+                return parse_library_article(response.json())
+        
+        if source == "cando" and "pgdx=" not in (link or ""):
+            # 이전에 목록 주소로 저장된 프로그램은 프로그램 ID로 상세 페이지 주소를 만듦
+            if not article_id or is_content_hash_id(article_id):
+                raise ValueError("캔두 프로그램 ID가 없습니다.")
+            link = CANDO_VIEW_URL.format(article_id)
+        if not link or not link.startswith("http"):
+            raise ValueError("상세 페이지 링크가 없습니다.")
+        if source == "cando":
+            for cookie in load_cando_cookies():
+                session.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"])
+        html = self._fetch_html(link)
+        with self._stage("extraction"):
+            return parse_notice_body(html, link)
+
     def close(self):
-        """드라이버 종료"""
+        """드라이버 및 HTTP 세션 종료"""
+        if self.session:
+            try:
+                self.session.close()
+            except:
+                pass
+            self.session = None
         if self.driver:
             try:
                 self.driver.quit()
@@ -0,0 +1,131 @@
+"""한글 검색 인덱스 (일반 검색 + 초성 검색)
+
+제목과 태그를 공백 제거·소문자 형태와 초성 형태로 저장하고,
+각 형태의 n-gram(1~2글자) → 문서 목록을 유지한다.
+검색어의 n-gram 목록을 교집합한 후보만 실제 부분 문자열 비교를 하므로
+공지 수가 늘어나도 검색 비용은 후보 수에 비례한다.
+"""
+import re
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+JUNGSEONG_JONGSEONG_COUNT = 21 * 28
+
+
+def normalize_text(text):
+    """공백 제거 + 소문자 (프론트엔드 normalizeText와 동일)"""
+    return re.sub(r'\s+', '', text or "").lower()
+
+
+def get_choseong(text):
+    """한글 음절을 초성으로 변환 (es-hangul getChoseong과 동일하게 초성·공백 외 문자는 제거)"""
+    result = []
+    for char in text or "":
+        code = ord(char)
+        if HANGUL_START <= code <= HANGUL_END:
+            result.append(CHOSEONG[(code - HANGUL_START) // JUNGSEONG_JONGSEONG_COUNT])
+        elif char in CHOSEONG or char.isspace():
+            result.append(char)
+    return "".join(result)
+
+
+def is_choseong_only(text):
+    """초성으로만 이루어진 문자열인지 확인"""
+    return bool(text) and all(char in CHOSEONG for char in text)
+
+
+def _ngrams(text):
+    """1글자 및 2글자 n-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(query):
+    """검색어 후보 조회에 쓸 n-gram (2글자 이상이면 2-gram만 사용)"""
+    if len(query) == 1:
+        return {query}
+    return {query[i:i + 2] for i in range(len(query) - 1)}
+
+
+class SearchIndex:
+    def __init__(self):
+        self._forms = {}      # doc_id -> (일반 형태 목록, 초성 형태 목록)
+        self._postings = {}   # n-gram -> doc_id 집합 (일반 형태)
+        self._choseong = {}   # n-gram -> doc_id 집합 (초성 형태)
+
+    def __len__(self):
+        return len(self._forms)
+
+    def add(self, doc_id, title, tags=()):
+        """문서의 제목과 태그를 색인"""
+        if doc_id in self._forms:
+            self.remove(doc_id)
+
+        fields = [title or ""] + list(tags)
+        normalized = [normalize_text(field) for field in fields]
+        choseong = [normalize_text(get_choseong(field)) for field in fields]
+        self._forms[doc_id] = (normalized, choseong)
+
+        for form in normalized:
+            for gram in _ngrams(form):
+                self._postings.setdefault(gram, set()).add(doc_id)
+        for form in choseong:
+            for gram in _ngrams(form):
+                self._choseong.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id):
+        """문서를 인덱스에서 제거"""
+        forms = self._forms.pop(doc_id, None)
+        if forms is None:
+            return
+        normalized, choseong = forms
+        _discard_postings(self._postings, normalized, doc_id)
+        _discard_postings(self._choseong, choseong, doc_id)
+
+    def search(self, query):
+        """검색어와 일치하는 doc_id 집합 반환 (초성만 입력하면 초성 검색도 함께 수행)"""
+        query = normalize_text(query)
+        if not query:
+            return set(self._forms)
+
+        matched = self._lookup(self._postings, query, 0)
+        if is_choseong_only(query):
+            matched |= self._lookup(self._choseong, query, 1)
+        return matched
+
+    def _lookup(self, postings, query, form_index):
+        """n-gram 교집합으로 후보를 좁힌 뒤 부분 문자열 여부 확인"""
+        posting_sets = []
+        for gram in _query_grams(query):
+            docs = postings.get(gram)
+            if not docs:
+                return set()
+            posting_sets.append(docs)
+        posting_sets.sort(key=len)
+
+        candidates = set(posting_sets[0])
+        for docs in posting_sets[1:]:
+            candidates &= docs
+            if not candidates:
+                return candidates
+
+        if len(query) <= 2:
+            return candidates
+        return {
+            doc_id for doc_id in candidates
+            if any(query in form for form in self._forms[doc_id][form_index])
+        }
+
+
+def _discard_postings(postings, forms, doc_id):
+    """문서의 n-gram 목록에서 doc_id 제거 (빈 목록은 삭제)"""
+    for form in forms:
+        for gram in _ngrams(form):
+            docs = postings.get(gram)
+            if docs is None:
+                continue
+            docs.discard(doc_id)
+            if not docs:
+                del postings[gram]
@@ -0,0 +1,185 @@
+"""캐시 스냅샷 파일
+
+캐시 저장(cache.snap)과 크롤러 프로세스 → API 워커 공유 스냅샷(snapshot.snap)에 함께 쓰는 형식.
+
+    "NSNP" | 버전(u16) | 헤더 길이(u32) | 헤더(JSON) | 소스별 섹션 ...
+
+헤더에는 메타 정보와 소스별 섹션의 위치·길이·건수·다이제스트·태그가 들어 있고, 섹션에는 소스의
+공지 목록이 compact JSON 배열로 들어 있다. 파일은 mmap으로 열어 필요한 소스의 섹션만 디코딩하므로
+API 워커는 다이제스트가 바뀐 소스만 다시 읽는다. 쓰기는 임시 파일에 쓴 뒤 rename으로 교체하며,
+교체 전 파일을 열고 있던 쪽은 이전 내용을 끝까지 읽을 수 있다.
+
+디버깅용 JSON 내보내기 (이전 cache.json과 같은 구조):
+
+    python snapshot.py cache.snap cache.json
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+
+MAGIC = b"NSNP"
+SNAPSHOT_VERSION = 2
+_PREFIX = struct.Struct("<4sHI")  # 매직, 버전, 헤더 길이
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SectionCache:
+    def __init__(self):
+        self._sections = {}  # 소스 -> (버전, 섹션 바이트, 다이제스트)
+
+    def encode(self, source, version, notices):
+        """소스 공지 목록의 섹션 바이트와 다이제스트 (버전이 그대로면 이전 결과 재사용)"""
+        cached = self._sections.get(source)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+        data = _dumps(notices)
+        digest = hashlib.sha1(data).hexdigest()[:16]
+        self._sections[source] = (version, data, digest)
+        return data, digest
+
+
+def encode_snapshot(meta, entries):
+    """entries: {소스: {"section", "digest", "count", "tags", "last_updated"}} → 파일 바이트"""
+    sections = {}
+    chunks = []
+    offset = 0
+    for source, entry in entries.items():
+        sections[source] = {
+            "offset": offset,
+            "length": len(entry["section"]),
+            "count": entry["count"],
+            "digest": entry["digest"],
+            "tags": entry["tags"],
+            "last_updated": entry["last_updated"]
+        }
+        chunks.append(entry["section"])
+        offset += len(entry["section"])
+    header = _dumps({"meta": meta, "sections": sections})
+    return b"".join([_PREFIX.pack(MAGIC, SNAPSHOT_VERSION, len(header)), header] + chunks)
+
+
+def _atomic_write(path, data, mode="wb", encoding=None):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode, encoding=encoding) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_snapshot(path, data):
+    """임시 파일에 쓰고 rename으로 교체 (원자적)"""
+    _atomic_write(path, data)
+
+
+class SnapshotFile:
+    """mmap으로 연 스냅샷 (소스 섹션은 요청할 때 디코딩). 소스 키로 조회하는 매핑처럼 쓸 수 있다"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, header_len = _PREFIX.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError("스냅샷 파일 형식이 아닙니다")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"지원하지 않는 스냅샷 버전: {version}")
+            header = json.loads(self._mmap[_PREFIX.size:_PREFIX.size + header_len])
+        except Exception:
+            self._mmap.close()
+            raise
+        self._base = _PREFIX.size + header_len
+        self.meta = header["meta"]
+        self._sections = header["sections"]
+
+    def sources(self):
+        return list(self._sections)
+
+    def info(self, source):
+        """섹션 정보 (건수, 다이제스트, 태그, last_updated)"""
+        return self._sections[source]
+
+    def load_source(self, source):
+        """소스 하나의 캐시 항목 {"data", "tags", "last_updated"}"""
+        info = self._sections[source]
+        start = self._base + info["offset"]
+        return {
+            "data": json.loads(self._mmap[start:start + info["length"]]),
+            "tags": list(info["tags"]),
+            "last_updated": info["last_updated"]
+        }
+
+    def __contains__(self, source):
+        return source in self._sections
+
+    def __getitem__(self, source):
+        return self.load_source(source)
+
+    def close(self):
+        self._mmap.close()
+
+
+def export_json(snapshot_path, json_path):
+    """스냅샷을 사람이 읽을 수 있는 JSON으로 내보내기 (디버깅용)"""
+    snapshot = SnapshotFile(snapshot_path)
+    try:
+        exported = {source: snapshot.load_source(source) for source in snapshot.sources()}
+    finally:
+        snapshot.close()
+    _atomic_write(json_path, json.dumps(exported, ensure_ascii=False, indent=2), mode="w", encoding="utf-8")
+
+
+class SnapshotReader:
+    def __init__(self, path):
+        self.path = path
+        self._stat_key = None
+        self._current = None
+
+    def _current_key(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def poll(self):
+        """파일이 교체되었으면 새 SnapshotFile, 그대로거나 없으면 None (이전 파일은 닫음)"""
+        key = self._current_key()
+        if key is None or key == self._stat_key:
+            return None
+
+        # 손상된 파일은 다음 교체 때까지 다시 읽지 않음
+        self._stat_key = key
+        snapshot = SnapshotFile(self.path)
+        old, self._current = self._current, snapshot
+        if old is not None:
+            old.close()
+        return snapshot
+
+    def close(self):
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("사용법: python snapshot.py <스냅샷 파일> <JSON 파일>")
+        sys.exit(2)
+    export_json(sys.argv[1], sys.argv[2])
+    print(f"내보내기 완료: {sys.argv[2]}")
@@ -0,0 +1,289 @@
+"""SQLite 기반 공지사항 저장소
+
+cache.json 전체를 다시 쓰는 대신 바뀐 공지만 upsert 한다.
+WAL 모드라 크롤러가 쓰는 동안에도 다른 프로세스(읽기 전용 복제본 등)가 시작 시 불러올 수 있다.
+API 조회는 이 DB가 아니라 메모리 인덱스(notice_index)에서 처리한다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from notice_ids import derive_article_id
+from notice_index import date_sort_key, feed_sort_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notices (
+    source TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT,
+    date TEXT,
+    sort_date TEXT,
+    status TEXT,
+    data TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (source, article_id)
+);
+
+CREATE TABLE IF NOT EXISTS notice_tags (
+    source TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (source, article_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_notice_tags_tag ON notice_tags (tag);
+
+CREATE TABLE IF NOT EXISTS sources (
+    source TEXT PRIMARY KEY,
+    tags TEXT NOT NULL,
+    last_updated TEXT
+);
+
+-- 보존 기간이 지나 hot set에서 빠진 공지 (본문은 zlib 압축 JSON)
+CREATE TABLE IF NOT EXISTS archived_notices (
+    source TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT,
+    sort_date TEXT,
+    data BLOB NOT NULL,
+    archived_at TEXT NOT NULL,
+    PRIMARY KEY (source, article_id)
+);
+CREATE INDEX IF NOT EXISTS idx_archived_sort_date ON archived_notices (sort_date);
+CREATE INDEX IF NOT EXISTS idx_archived_source_sort_date ON archived_notices (source, sort_date);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# 이전 버전 DB에 없는 컬럼 (테이블, 컬럼, 정의)
+ADDED_COLUMNS = [
+    ("archived_notices", "link", "TEXT"),
+    ("notices", "sort_date", "TEXT"),
+]
+
+# 컬럼 추가 후에 만드는 인덱스 (date는 '2025.11.25', '2025-11-25' 등 형식이 섞여 있어 정규화한 sort_date로 정렬)
+INDEXES = """
+DROP INDEX IF EXISTS idx_notices_date;
+DROP INDEX IF EXISTS idx_notices_source_date;
+CREATE INDEX IF NOT EXISTS idx_notices_sort_date ON notices (sort_date);
+CREATE INDEX IF NOT EXISTS idx_notices_source_sort_date ON notices (source, sort_date);
+"""
+
+
+def notice_article_id(notice):
+    """공지의 게시판 글 번호 (없으면 링크·해시로 결정)"""
+    return notice.get("articleId") or derive_article_id(notice.get("title", ""), notice.get("link", ""))
+
+
+def notice_content_hash(notice):
+    """변경 감지용 해시"""
+    raw = json.dumps(notice, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()
+
+
+class SQLiteStore:
+    def __init__(self, path, read_only=False):
+        """read_only: 크롤링하지 않는 프로세스용. 스키마 생성·마이그레이션 없이 읽기 전용으로 연다
+        (DB 파일이 없으면 만들지 않고 sqlite3.OperationalError)"""
+        self.path = path
+        self.read_only = read_only
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        if read_only:
+            columns = {row[1] for row in self._connect().execute("PRAGMA table_info(notices)")}
+            # sort_date 컬럼이 생기기 전 DB는 크롤러가 열어 마이그레이션할 때까지 date로 정렬
+            self._sort_column = "sort_date" if "sort_date" in columns else "date"
+            return
+        self._sort_column = "sort_date"
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            for table, column, definition in ADDED_COLUMNS:
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            # sort_date 컬럼이 생기기 전에 저장된 공지
+            conn.executemany(
+                "UPDATE notices SET sort_date = ? WHERE source = ? AND article_id = ?",
+                [(feed_sort_key(json.loads(data)), source, article_id) for source, article_id, data in
+                 conn.execute("SELECT source, article_id, data FROM notices WHERE sort_date IS NULL").fetchall()])
+            conn.executescript(INDEXES)
+
+    def _connect(self):
+        """스레드별 연결 (WAL 모드, read_only면 읽기 전용 연결)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.read_only:
+                conn = sqlite3.connect(Path(self.path).absolute().as_uri() + "?mode=ro", uri=True, timeout=30)
+            else:
+                conn = sqlite3.connect(self.path, timeout=30)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def is_empty(self):
+        row = self._connect().execute("SELECT 1 FROM notices LIMIT 1").fetchone()
+        return row is None
+
+    def upsert_source(self, source, notices, tags, last_updated):
+        """소스 하나의 공지를 저장. 내용이 바뀐 행만 쓰고, 목록에서 빠진 행은 삭제.
+        (추가·변경된 행 수, 삭제된 행 수) 반환
+        """
+        now = datetime.now().isoformat()
+        rows = {}
+        for notice in notices:
+            rows[notice_article_id(notice)] = notice
+
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                existing = dict(conn.execute(
+                    "SELECT article_id, content_hash FROM notices WHERE source = ?", (source,)))
+
+                changed = 0
+                for article_id, notice in rows.items():
+                    content_hash = notice_content_hash(notice)
+                    if existing.get(article_id) == content_hash:
+                        continue
+                    conn.execute(
+                        """INSERT INTO notices (source, article_id, title, link, date, sort_date, status, data,
+                                                   content_hash, updated_at)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                           ON CONFLICT (source, article_id) DO UPDATE SET
+                               title = excluded.title, link = excluded.link, date = excluded.date,
+                               sort_date = excluded.sort_date, status = excluded.status, data = excluded.data,
+                               content_hash = excluded.content_hash, updated_at = excluded.updated_at""",
+                        (source, article_id, notice.get("title", ""), notice.get("link"),
+                         notice.get("date"), feed_sort_key(notice), notice.get("status"),
+                         json.dumps(notice, ensure_ascii=False), content_hash, now))
+                    conn.execute("DELETE FROM notice_tags WHERE source = ? AND article_id = ?",
+                                 (source, article_id))
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO notice_tags (source, article_id, tag) VALUES (?, ?, ?)",
+                        [(source, article_id, tag) for tag in notice.get("tags", [])])
+                    changed += 1
+
+                removed = [(source, article_id) for article_id in existing if article_id not in rows]
+                if removed:
+                    conn.executemany("DELETE FROM notices WHERE source = ? AND article_id = ?", removed)
+                    conn.executemany("DELETE FROM notice_tags WHERE source = ? AND article_id = ?", removed)
+
+                conn.execute(
+                    """INSERT INTO sources (source, tags, last_updated) VALUES (?, ?, ?)
+                       ON CONFLICT (source) DO UPDATE SET tags = excluded.tags, last_updated = excluded.last_updated""",
+                    (source, json.dumps(sorted(tags), ensure_ascii=False), last_updated))
+
+        return changed, len(removed)
+
+    def load_source(self, source):
+        """소스 하나를 캐시 형태({"data", "tags", "last_updated"})로 읽기"""
+        conn = self._connect()
+        data = [json.loads(row[0]) for row in conn.execute(
+            f"SELECT data FROM notices WHERE source = ? ORDER BY {self._sort_column} DESC, article_id DESC",
+            (source,))]
+        row = conn.execute("SELECT tags, last_updated FROM sources WHERE source = ?", (source,)).fetchone()
+        tags, last_updated = (json.loads(row[0]), row[1]) if row else ([], None)
+        return {"data": data, "tags": tags, "last_updated": last_updated}
+
+    def load_all(self, source_keys):
+        """모든 소스를 캐시 형태로 읽기"""
+        return {source: self.load_source(source) for source in source_keys}
+
+    def count_by_source(self):
+        """소스별 저장된 공지 수"""
+        return dict(self._connect().execute("SELECT source, COUNT(*) FROM notices GROUP BY source"))
+
+    def archive_notices(self, source, notices):
+        """hot set에서 빠진 공지를 아카이브에 저장 (이미 있으면 덮어씀). 저장한 건수 반환"""
+        now = datetime.now().isoformat()
+        rows = [
+            (source, notice_article_id(notice), notice.get("title", ""), notice.get("link", ""),
+             date_sort_key(notice.get("date")),
+             zlib.compress(json.dumps(notice, ensure_ascii=False, separators=(",", ":")).encode("utf-8")), now)
+            for notice in notices
+        ]
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    """INSERT OR REPLACE INTO archived_notices (source, article_id, title, link, sort_date, data, archived_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""", rows)
+        return len(rows)
+
+    def query_archive(self, source=None, q=None, limit=50, offset=0):
+        """아카이브 조회 (최신순). (공지 목록, 다음 페이지 존재 여부) 반환"""
+        conditions, params = [], []
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if q:
+            conditions.append("title LIKE ? ESCAPE '\\'")
+            escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._connect().execute(
+            f"SELECT data FROM archived_notices {where} ORDER BY sort_date DESC, article_id DESC LIMIT ? OFFSET ?",
+            params + [limit + 1, offset]).fetchall()
+        notices = [json.loads(zlib.decompress(row[0])) for row in rows[:limit]]
+        return notices, len(rows) > limit
+
+    def archived_keys(self):
+        """아카이브된 공지의 {소스: {글 번호: (제목, 링크)}} (다시 수집하지 않도록 크롤러가 사용)"""
+        keys = {}
+        rows = self._connect().execute(
+            "SELECT source, article_id, title, link, CASE WHEN link IS NULL THEN data END FROM archived_notices")
+        for source, article_id, title, link, data in rows:
+            if link is None:
+                # link 컬럼이 생기기 전에 아카이브된 공지
+                link = json.loads(zlib.decompress(data)).get("link", "")
+            keys.setdefault(source, {})[article_id] = (title, link)
+        return keys
+
+    def count_archived(self):
+        """소스별 아카이브 공지 수"""
+        return dict(self._connect().execute("SELECT source, COUNT(*) FROM archived_notices GROUP BY source"))
+
+    def get_meta(self, key):
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def migrate_from_json(self, json_path, source_keys):
+        """기존 cache.json을 한 번만 가져오기. 가져온 공지 수 반환 (이미 가져왔거나 파일이 없으면 0)"""
+        if self.get_meta("migrated_from_json") or not os.path.exists(json_path):
+            return 0
+
+        with open(json_path, 'r', encoding='utf-8') as f:
+            loaded_cache = json.load(f)
+
+        total = 0
+        for source in source_keys:
+            entry = loaded_cache.get(source)
+            if not entry:
+                continue
+            self.upsert_source(source, entry.get("data", []), entry.get("tags", []), entry.get("last_updated"))
+            total += len(entry.get("data", []))
+
+        self.set_meta("migrated_from_json", datetime.now().isoformat())
+        return total
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
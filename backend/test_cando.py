@@ -2,6 +2,7 @@ from scraper import NoticeScraper, load_cando_cookies
 import time
 
 s = NoticeScraper()
+s._ensure_driver()
 
 # 먼저 도메인 접속
 s.driver.get('https://cando.hoseo.ac.kr')
@@ -0,0 +1,14 @@
+"""API 워커 WSGI 진입점
+
+크롤링은 crawler.py 프로세스 하나가 맡고, 워커들은 공유 스냅샷만 읽으므로 워커 수만큼 브라우저가 늘지 않는다.
+NOTICE_CRAWLER_MODE=off면 크롤러 없이 저장된 캐시만 제공한다. 어느 쪽이든 Selenium은 불러오지 않는다.
+
+    python crawler.py
+    gunicorn -w 4 -b 0.0.0.0:5000 wsgi:app
+"""
+from app import app, CRAWLER_MODE, start_serve_only, start_snapshot_watcher
+
+if CRAWLER_MODE == "off":
+    start_serve_only()
+else:
+    start_snapshot_watcher()
@@ -113,9 +113,11 @@ function App() {
   const filteredNotices = useMemo(() => {
     let filtered = notices;
     
-    // 소스 필터
+    // 소스 필터 (여러 게시판에 올라온 호서대 공지는 categories로 판단)
     if (selectedSource) {
-      filtered = filtered.filter(notice => notice.source === selectedSource);
+      filtered = filtered.filter(notice =>
+        (notice.categories || [notice.source]).includes(selectedSource)
+      );
     }
     
     // 태그 필터